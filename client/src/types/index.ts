@@ -26,6 +26,7 @@ export interface ScoringSystem {
 export interface BlendRequest {
   session_id: string;
   object_ids: number[];
+  session_token?: string;
 }
 
 export interface BlendResponse {
@@ -35,6 +36,7 @@ export interface BlendResponse {
   total_scores: Record<string, number>;
   newly_unlocked_systems: string[];
   newly_unlocked_objects: GameObject[];
+  session_token?: string;
 }
 
 export interface SessionResponse {
@@ -8,6 +8,13 @@ import {
   SessionResponse,
   LeaderboardResponse,
 } from '../types';
+import {
+  getSessionToken,
+  setSessionToken,
+  clearSessionToken,
+  getLastWrite,
+  setLastWrite,
+} from './session';
 
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8000';
 
@@ -18,11 +25,30 @@ const api = axios.create({
   },
 });
 
+/**
+ * X-Session-Token header for token based sessions, and X-Last-Write after
+ * the session was written (so reads of it skip a lagging read replica)
+ */
+function sessionHeaders(sessionId: string): Record<string, string> {
+  const headers: Record<string, string> = {};
+  const token = getSessionToken(sessionId);
+  if (token) {
+    headers['X-Session-Token'] = token;
+  }
+  const lastWrite = getLastWrite(sessionId);
+  if (lastWrite) {
+    headers['X-Last-Write'] = lastWrite;
+  }
+  return headers;
+}
+
 /**
  * Fetch session information
  */
 export async function fetchSession(sessionId: string): Promise<SessionResponse> {
-  const response = await api.get<SessionResponse>(`/api/scores/session/${sessionId}`);
+  const response = await api.get<SessionResponse>(`/api/scores/session/${sessionId}`, {
+    headers: sessionHeaders(sessionId),
+  });
   return response.data;
 }
 
@@ -59,7 +85,12 @@ export async function blendObjects(
   const response = await api.post<BlendResponse>('/api/scores/blend', {
     session_id: sessionId,
     object_ids: objectIds,
+    session_token: getSessionToken(sessionId) ?? undefined,
   });
+  if (response.data.session_token) {
+    setSessionToken(sessionId, response.data.session_token);
+  }
+  setLastWrite(sessionId, response.headers['x-last-write']);
   return response.data;
 }
 
@@ -67,7 +98,9 @@ export async function blendObjects(
  * Reset a session
  */
 export async function resetSession(sessionId: string): Promise<void> {
-  await api.post(`/api/scores/reset/${sessionId}`);
+  const response = await api.post(`/api/scores/reset/${sessionId}`);
+  clearSessionToken(sessionId);
+  setLastWrite(sessionId, response.headers['x-last-write']);
 }
 
 /**
@@ -99,7 +132,9 @@ export async function submitToLeaderboard(
   sessionId: string,
   playerName: string
 ): Promise<void> {
-  await api.post(`/api/leaderboard/submit/${sessionId}`, null, {
+  const response = await api.post(`/api/leaderboard/submit/${sessionId}`, null, {
     params: { player_name: playerName },
+    headers: sessionHeaders(sessionId),
   });
+  setLastWrite(sessionId, response.headers['x-last-write']);
 }
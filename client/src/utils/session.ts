@@ -3,6 +3,8 @@
  */
 
 const SESSION_KEY = 'chaos_blender_session';
+const TOKEN_KEY_PREFIX = 'chaos_blender_token:';
+const LAST_WRITE_KEY_PREFIX = 'chaos_blender_last_write:';
 
 export function getSessionId(): string {
   let sessionId = localStorage.getItem(SESSION_KEY);
@@ -22,3 +24,31 @@ export function clearSession(): void {
 export function setSessionId(sessionId: string): void {
   localStorage.setItem(SESSION_KEY, sessionId);
 }
+
+/**
+ * Signed session state, when the server runs with session tokens enabled
+ */
+export function getSessionToken(sessionId: string): string | null {
+  return localStorage.getItem(TOKEN_KEY_PREFIX + sessionId);
+}
+
+export function setSessionToken(sessionId: string, token: string): void {
+  localStorage.setItem(TOKEN_KEY_PREFIX + sessionId, token);
+}
+
+export function clearSessionToken(sessionId: string): void {
+  localStorage.removeItem(TOKEN_KEY_PREFIX + sessionId);
+}
+
+/**
+ * Marker of the session's last write, sent back so reads see that write
+ */
+export function getLastWrite(sessionId: string): string | null {
+  return localStorage.getItem(LAST_WRITE_KEY_PREFIX + sessionId);
+}
+
+export function setLastWrite(sessionId: string, marker: unknown): void {
+  if (typeof marker === 'string' && marker) {
+    localStorage.setItem(LAST_WRITE_KEY_PREFIX + sessionId, marker);
+  }
+}
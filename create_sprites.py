@@ -1,26 +1,284 @@
 #!/usr/bin/env python3
 """
 Generate pixelated SVG sprites for all game objects with object-specific designs
+
+Usage: python create_sprites.py [OUT_DIR] [--jobs N] [--hashed-names] [--force]
+                                 [--png-scales 4,8,16,32]
+
+Builds are incremental: each sprite's pattern and color are hashed and
+sprites whose hash is unchanged since the last build are not re-rendered.
+PNG output (for clients that need bitmaps) requires NumPy.
 """
+import argparse
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+SVG_OPEN = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 64 64" style="image-rendering: pixelated; image-rendering: crisp-edges;">'
+SVG_NS = "http://www.w3.org/2000/svg"
+GRID_SIZE = 8  # Patterns are 8x8 cells
+
+# Output file names
+SHEET_NAME = "sprite-sheet.svg"
+MANIFEST_NAME = "sprite-manifest.json"
+ALIASES_NAME = "sprite-aliases.json"
+STORE_DIR = "cas"  # Content-addressed store: one HASH.svg per unique (pattern, color)
+BUILD_CACHE_NAME = ".sprite-build.json"
+
+# Bump when the SVG encoding changes so every sprite is re-rendered
+RENDERER_VERSION = 2
+
+
+def merge_pixel_runs(pixels):
+    """
+    Merge pixels into rectangles (x, y, width, height) in pixel units.
+    Each row is split into horizontal runs, then runs with the same start and
+    width in consecutive rows are stacked into one rectangle.
+    """
+    rows = {}
+    for px, py in set(pixels):
+        rows.setdefault(py, []).append(px)
+
+    open_rects = {}  # (x, width) -> [x, y, width, height] still growing downwards
+    rects = []
+    for py in sorted(rows):
+        xs = sorted(rows[py])
+        runs = []
+        start = prev = xs[0]
+        for px in xs[1:]:
+            if px != prev + 1:
+                runs.append((start, prev - start + 1))
+                start = px
+            prev = px
+        runs.append((start, prev - start + 1))
+
+        still_open = {}
+        for run in runs:
+            rect = open_rects.get(run)
+            if rect is not None and rect[1] + rect[3] == py:
+                rect[3] += 1
+            else:
+                rect = [run[0], py, run[1], 1]
+                rects.append(rect)
+            still_open[run] = rect
+        open_rects = still_open
+
+    return [tuple(rect) for rect in rects]
+
+
+def pixels_to_path(pixels, pixel_size=8):
+    """SVG path data covering exactly the given pixels, one subpath per merged rectangle"""
+    return ''.join(
+        f'M{x * pixel_size} {y * pixel_size}h{w * pixel_size}v{h * pixel_size}h-{w * pixel_size}z'
+        for x, y, w, h in merge_pixel_runs(pixels)
+    )
+
 
 def create_pixelated_svg(name, color, pixels, size=64, pixel_size=8):
-    """Create a pixelated SVG sprite with custom pattern"""
+    """Create a pixelated SVG sprite with custom pattern, drawn as a single path"""
+
+    svg_parts = [SVG_OPEN]
 
-    svg_parts = ['<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 64 64" style="image-rendering: pixelated; image-rendering: crisp-edges;">']
+    # Draw pixels, merged into runs
+    svg_parts.append(f'  <path d="{pixels_to_path(pixels, pixel_size)}" fill="{color}"/>')
+
+    # Add outer border for definition
+    svg_parts.append(f'  <rect x="2" y="2" width="60" height="60" fill="none" stroke="{color}" stroke-width="1" opacity="0.2"/>')
+
+    svg_parts.append('</svg>')
+
+    return '\n'.join(svg_parts)
+
+
+def create_rect_svg(name, color, pixels, size=64, pixel_size=8):
+    """Previous one-<rect>-per-pixel encoding, kept as the baseline for size reports"""
+
+    svg_parts = [SVG_OPEN]
 
-    # Draw pixels
     for px, py in pixels:
         x = px * pixel_size
         y = py * pixel_size
         svg_parts.append(f'  <rect x="{x}" y="{y}" width="{pixel_size}" height="{pixel_size}" fill="{color}"/>')
 
-    # Add outer border for definition
     svg_parts.append(f'  <rect x="2" y="2" width="60" height="60" fill="none" stroke="{color}" stroke-width="1" opacity="0.2"/>')
 
     svg_parts.append('</svg>')
 
     return '\n'.join(svg_parts)
 
+
+def svg_to_symbol(symbol_id, svg_text):
+    """Turn a standalone sprite SVG into a <symbol> for the sprite sheet"""
+    import xml.etree.ElementTree as ET
+
+    ET.register_namespace('', SVG_NS)
+    root = ET.fromstring(svg_text)
+    attrs = f' id="{symbol_id}" viewBox="{root.get("viewBox", "0 0 64 64")}"'
+    if root.get("style"):
+        attrs += f' style="{root.get("style")}"'
+    body = ''.join(
+        ET.tostring(child, encoding='unicode').replace(f' xmlns="{SVG_NS}"', '').strip()
+        for child in root
+    )
+    return f'<symbol{attrs}>{body}</symbol>'
+
+
+def build_sprite_sheet(sprite_svgs, paths=None):
+    """
+    Build a single SVG of <symbol>s plus its manifest from {name: svg_text}.
+    Sprites are referenced as <use href="/sprites/sprite-sheet.svg?v=VERSION#NAME"/>.
+    `paths` maps names to their standalone file when it isn't NAME.svg.
+    """
+    paths = paths or {}
+    # Sprites with identical content share one symbol, named after the first of them
+    symbol_ids = {}
+    symbols = []
+    for name, svg_sprite in sorted(sprite_svgs.items()):
+        if svg_sprite not in symbol_ids:
+            symbol_ids[svg_sprite] = name
+            symbols.append(svg_to_symbol(name, svg_sprite))
+    sheet = '\n'.join([f'<svg xmlns="{SVG_NS}" style="display: none;">', *symbols, '</svg>']) + '\n'
+    version = hashlib.sha256(sheet.encode()).hexdigest()[:16]
+    manifest = {
+        "version": version,
+        "sheet": f"/sprites/{SHEET_NAME}?v={version}",
+        "sprites": {
+            name: {"id": symbol_ids[sprite_svgs[name]], "path": f"/sprites/{paths.get(name, name + '.svg')}"}
+            for name in sorted(sprite_svgs)
+        },
+    }
+    return sheet, manifest
+
+
+def write_sprite_sheet(sprite_dir, generated_files):
+    """
+    Bundle the generated sprites ({name: filename}) and any hand-drawn
+    NAME.svg files in sprite_dir into the sheet and manifest
+    """
+    files = dict(generated_files)
+    for filename in sorted(os.listdir(sprite_dir)):
+        stem = filename[:-4]
+        if (filename.endswith('.svg') and filename != SHEET_NAME and '.' not in stem
+                and stem not in files and os.path.isfile(os.path.join(sprite_dir, filename))):
+            files[stem] = filename
+
+    sprite_svgs = {}
+    for name, filename in files.items():
+        with open(os.path.join(sprite_dir, filename)) as f:
+            sprite_svgs[name] = f.read()
+
+    sheet, manifest = build_sprite_sheet(sprite_svgs, files)
+    write_if_changed(os.path.join(sprite_dir, SHEET_NAME), sheet)
+    write_if_changed(os.path.join(sprite_dir, MANIFEST_NAME), json.dumps(manifest, indent=2) + '\n')
+    return manifest
+
+
+def write_atomic(path, content):
+    """Write via a temporary file and rename, so readers never see a partial file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb' if isinstance(content, bytes) else 'w') as f:
+            f.write(content)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_if_changed(path, content):
+    """Atomically write content unless the file already holds it; returns True if written"""
+    try:
+        with open(path, 'rb' if isinstance(content, bytes) else 'r') as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    write_atomic(path, content)
+    return True
+
+
+def parse_hex_color(color):
+    """'#RRGGBB' -> (r, g, b, 255)"""
+    if len(color) != 7 or not color.startswith('#'):
+        raise ValueError(f"Unsupported color {color!r}")
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5)) + (255,)
+
+
+def pattern_to_mask(pixels, grid=GRID_SIZE):
+    """Boolean (grid, grid) array indexed [y, x] with True for filled cells"""
+    import numpy as np
+
+    mask = np.zeros((grid, grid), dtype=bool)
+    if pixels:
+        xs, ys = np.array(sorted(set(pixels))).T
+        mask[ys, xs] = True
+    return mask
+
+
+def rasterize_pattern(pixels, color, scale):
+    """
+    Rasterize one pattern to an RGBA uint8 array of (8 * scale, 8 * scale, 4),
+    each cell becoming a scale x scale block. Background is transparent.
+    """
+    return rasterize_patterns([(pixels, color)], [scale])[scale][0]
+
+
+def rasterize_patterns(items, scales):
+    """
+    Rasterize many (pixels, color) pairs at several scales in one pass.
+    Returns {scale: uint8 array of shape (len(items), 8 * scale, 8 * scale, 4)}.
+    The 8x8 RGBA base images are built once and upscaled with np.repeat,
+    so the cost is a few array copies per scale rather than per-pixel drawing.
+    """
+    import numpy as np
+
+    masks = np.stack([pattern_to_mask(pixels) for pixels, _ in items])
+    colors = np.array([parse_hex_color(color) for _, color in items], dtype=np.uint8)
+    base = masks[..., None] * colors[:, None, None, :]  # (N, 8, 8, 4)
+    return {
+        scale: base.repeat(scale, axis=1).repeat(scale, axis=2)
+        for scale in scales
+    }
+
+
+def encode_png(rgba):
+    """Encode an (H, W, 4) uint8 array as PNG bytes (no filtering, zlib level 9)"""
+    import numpy as np
+
+    height, width, _ = rgba.shape
+    # Each scanline is prefixed with filter type 0 (None)
+    raw = np.concatenate([np.zeros((height, 1), dtype=np.uint8), rgba.reshape(height, width * 4)], axis=1)
+
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+
+    return b''.join([
+        b'\x89PNG\r\n\x1a\n',
+        chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)),
+        chunk(b'IDAT', zlib.compress(raw.tobytes(), 9)),
+        chunk(b'IEND', b''),
+    ])
+
+
+def write_pngs(out_dir, scales):
+    """Write png/NAME@SCALEx.png for every sprite; returns the number of files written"""
+    png_dir = os.path.join(out_dir, 'png')
+    os.makedirs(png_dir, exist_ok=True)
+    names = list(sprites)
+    items = [(object_patterns.get(name, object_patterns["default"]), sprites[name]) for name in names]
+    written = 0
+    for scale, images in rasterize_patterns(items, scales).items():
+        for name, image in zip(names, images):
+            written += write_if_changed(os.path.join(png_dir, f"{name}@{scale}x.png"), encode_png(image))
+    return written
+
+
 # Define custom patterns for each object
 object_patterns = {
     # Tier 1: Fruits - circular/round shapes
@@ -312,23 +570,150 @@ sprites = {
     "forgotten_color": "#808080",
 }
 
-# Create all sprite files
-import os
 
-sprite_dir = "/Users/lukeneal/chaos-blender/client/public/sprites"
-os.makedirs(sprite_dir, exist_ok=True)
+def sprite_hash(color, pattern):
+    """Content hash of everything that determines a sprite's output"""
+    key = json.dumps([RENDERER_VERSION, color, sorted(set(map(tuple, pattern)))])
+    return hashlib.sha256(key.encode()).hexdigest()[:12]
+
+
+def render_sprite(job):
+    """Render one sprite; runs in a worker process. Returns (name, svg, old rect-encoding size)"""
+    name, color, pattern = job
+    return name, create_pixelated_svg(name, color, pattern), len(create_rect_svg(name, color, pattern).encode())
+
+
+def build_sprites(out_dir, jobs=None, hashed_names=False, force=False):
+    """
+    Render changed sprites into out_dir and rebuild the sprite sheet.
+    With hashed_names, files are written as NAME.HASH.svg so they can be
+    served with immutable caching.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    cache_path = os.path.join(out_dir, BUILD_CACHE_NAME)
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (FileNotFoundError, ValueError):
+        cache = {}
+
+    files = {}
+    pending = []
+    for name, color in sprites.items():
+        # Get pattern - use object-specific or default
+        pattern = object_patterns.get(name, object_patterns["default"])
+        digest = sprite_hash(color, pattern)
+        filename = f"{name}.{digest}.svg" if hashed_names else f"{name}.svg"
+        entry = cache.get(name)
+        if (not force and entry == {"hash": digest, "file": filename}
+                and os.path.exists(os.path.join(out_dir, filename))):
+            files[name] = filename
+            continue
+        pending.append((name, color, pattern, digest, filename))
+
+    jobs_list = [(name, color, pattern) for name, color, pattern, _, _ in pending]
+    if len(pending) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            rendered = list(pool.map(render_sprite, jobs_list, chunksize=16))
+    else:
+        rendered = [render_sprite(job) for job in jobs_list]
+
+    total_before = total_after = 0
+    for (name, _, _, digest, filename), (_, svg_content, before) in zip(pending, rendered):
+        write_atomic(os.path.join(out_dir, filename), svg_content)
+        previous = cache.get(name, {}).get("file")
+        if previous and previous != filename and '.' in previous[:-4]:
+            # Drop the superseded content-hashed file
+            try:
+                os.remove(os.path.join(out_dir, previous))
+            except FileNotFoundError:
+                pass
+        cache[name] = {"hash": digest, "file": filename}
+        files[name] = filename
+
+        after = len(svg_content.encode())
+        total_before += before
+        total_after += after
+        print(f"Created: {filename} ({before} -> {after} bytes, -{100 * (before - after) / before:.0f}%)")
+
+    cache = {name: entry for name, entry in cache.items() if name in sprites}
+    write_if_changed(cache_path, json.dumps(cache, indent=2, sort_keys=True) + '\n')
+    unique = write_content_store(out_dir, files, {name: entry["hash"] for name, entry in cache.items()})
+    manifest = write_sprite_sheet(out_dir, files)
+    return {
+        "rendered": len(pending),
+        "skipped": len(sprites) - len(pending),
+        "unique": unique,
+        "bytes_before": total_before,
+        "bytes_after": total_after,
+        "manifest": manifest,
+    }
+
+
+def write_content_store(out_dir, files, hashes):
+    """
+    Write cas/HASH.svg once per unique sprite content, plus sprite-aliases.json
+    mapping each /sprites/NAME.svg path to its shared /sprites/cas/HASH.svg.
+    The API can rewrite GameObject.sprite_path through the alias map so the
+    browser downloads and caches shared sprites once.
+    Returns the number of unique files.
+    """
+    store_dir = os.path.join(out_dir, STORE_DIR)
+    os.makedirs(store_dir, exist_ok=True)
+
+    aliases = {}
+    for name, filename in sorted(files.items()):
+        digest = hashes[name]
+        store_path = os.path.join(store_dir, f"{digest}.svg")
+        if not os.path.exists(store_path):
+            with open(os.path.join(out_dir, filename)) as f:
+                write_atomic(store_path, f.read())
+        aliases[f"/sprites/{name}.svg"] = f"/sprites/{STORE_DIR}/{digest}.svg"
+
+    # Drop store entries no sprite refers to any more
+    live = {f"{digest}.svg" for digest in hashes.values()}
+    for filename in os.listdir(store_dir):
+        if filename.endswith('.svg') and filename not in live:
+            os.remove(os.path.join(store_dir, filename))
+
+    write_if_changed(os.path.join(out_dir, ALIASES_NAME), json.dumps(aliases, indent=2) + '\n')
+    return len(live)
+
+
+def main():
+    """Create all sprite files"""
+    parser = argparse.ArgumentParser(description="Generate pixelated SVG sprites")
+    parser.add_argument(
+        "out_dir", nargs="?",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "client", "public", "sprites"),
+        help="Output directory (default: client/public/sprites)"
+    )
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--hashed-names", action="store_true", help="Write NAME.HASH.svg for immutable caching")
+    parser.add_argument("--force", action="store_true", help="Re-render every sprite")
+    parser.add_argument(
+        "--png-scales", default="",
+        help="Also write PNGs at these comma-separated scales (pixels per cell), e.g. 4,8,16,32"
+    )
+    args = parser.parse_args()
 
-created_count = 0
-for name, color in sprites.items():
-    # Get pattern - use object-specific or default
-    pattern = object_patterns.get(name, object_patterns["default"])
+    start = time.perf_counter()
+    stats = build_sprites(args.out_dir, args.jobs, args.hashed_names, args.force)
+    if args.png_scales:
+        scales = [int(scale) for scale in args.png_scales.split(',')]
+        png_start = time.perf_counter()
+        written = write_pngs(args.out_dir, scales)
+        print(f"✓ Wrote {written} PNGs at scales {scales} ({time.perf_counter() - png_start:.2f}s)")
+    elapsed = time.perf_counter() - start
 
-    svg_content = create_pixelated_svg(name, color, pattern)
-    filepath = os.path.join(sprite_dir, f"{name}.svg")
+    print(f"\n✓ Rendered {stats['rendered']} sprites, {stats['skipped']} unchanged, in {args.out_dir} ({elapsed:.2f}s)")
+    if stats["bytes_before"]:
+        saved = stats["bytes_before"] - stats["bytes_after"]
+        print(f"  {stats['bytes_before']} -> {stats['bytes_after']} bytes (-{100 * saved / stats['bytes_before']:.0f}%)")
+    manifest = stats["manifest"]
+    print(f"✓ {STORE_DIR}/: {stats['unique']} unique sprites for {len(sprites)} objects, aliases in {ALIASES_NAME}")
+    print(f"✓ {SHEET_NAME}: {len(manifest['sprites'])} sprites (version {manifest['version']})")
 
-    with open(filepath, 'w') as f:
-        f.write(svg_content)
-    created_count += 1
-    print(f"Created: {name}.svg")
 
-print(f"\n✓ Created {created_count} object-specific pixelated sprite files in {sprite_dir}")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark the per-request cost of MetricsMiddleware
+
+Drives a minimal ASGI app directly (no sockets, no HTTP parsing) with and
+without the middleware, so the difference is the middleware's own overhead.
+
+Usage: python benchmarks/bench_metrics.py [requests]
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from metrics import MetricsMiddleware, registry  # noqa: E402
+
+
+class _Route:
+    path = "/api/scores/blend"
+
+
+async def bare_app(scope, receive, send):
+    # Mimic the router annotating the scope with the matched route
+    scope["route"] = _Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def _receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message):
+    pass
+
+
+async def run(app, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        scope = {"type": "http", "method": "POST", "path": "/api/scores/blend"}
+        await app(scope, _receive, _send)
+    return time.perf_counter() - start
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    instrumented = MetricsMiddleware(bare_app)
+
+    # Warm up both paths before timing
+    asyncio.run(run(bare_app, 1000))
+    asyncio.run(run(instrumented, 1000))
+
+    baseline = min(asyncio.run(run(bare_app, requests)) for _ in range(3))
+    with_metrics = min(asyncio.run(run(instrumented, requests)) for _ in range(3))
+    overhead_ns = (with_metrics - baseline) / requests * 1e9
+
+    print(f"requests:             {requests}")
+    print(f"bare app:             {baseline / requests * 1e9:8.0f} ns/request")
+    print(f"with MetricsMiddleware: {with_metrics / requests * 1e9:6.0f} ns/request")
+    print(f"middleware overhead:  {overhead_ns:8.0f} ns/request")
+    print(f"scrape size:          {len(registry.render())} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Compare JSON and MessagePack for typical API payloads
+
+Builds blend, session and leaderboard responses (the real response models)
+from the seed catalog and reports, per payload:
+- encoded size in each format
+- server CPU per response: JSON is serialized by pydantic's dump_json (what
+  FastAPI does); MessagePack clients additionally pay MsgPackMiddleware's
+  transcode (json.loads + msgpack.packb of that JSON). For comparison, the
+  cost of packing the model's data directly is shown too.
+- client decode time in each format
+
+MessagePack saves bandwidth, not server CPU: every MessagePack response
+costs the server the JSON encoding plus the transcode.
+
+Usage: python benchmarks/bench_msgpack.py [iterations]
+"""
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+import msgpack
+from pydantic import TypeAdapter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from schemas import (  # noqa: E402
+    BlendResponse, GameObjectResponse, LeaderboardEntry, LeaderboardResponse, SessionResponse
+)
+
+DATA = os.path.join(os.path.dirname(__file__), "..", "src", "data", "catalog.json")
+
+
+def _objects(catalog):
+    return [
+        GameObjectResponse(id=index, created_at=datetime(2025, 1, 1), **obj)
+        for index, obj in enumerate(catalog["game_objects"], start=1)
+    ]
+
+
+def payloads(catalog):
+    rng = random.Random(42)
+    systems = [system["name"] for system in catalog["scoring_systems"]]
+    objects = _objects(catalog)
+    scores = {system: rng.uniform(-500, 5000) for system in systems}
+    return {
+        "blend": BlendResponse(
+            success=True,
+            blend_count=42,
+            scores_added={system: rng.uniform(-50, 200) for system in systems[:6]},
+            total_scores=scores,
+            newly_unlocked_systems=systems[:1],
+            newly_unlocked_objects=objects[:2]
+        ),
+        "session": SessionResponse(
+            session_id="0b7e2b0c-6a49-4d8f-9d0c-3f1b9c8e2a51",
+            blend_count=42,
+            scores=scores,
+            unlocked_systems=systems,
+            available_objects=objects
+        ),
+        "leaderboard": LeaderboardResponse(
+            scoring_system=systems[0],
+            entries=[
+                LeaderboardEntry(
+                    player_name=f"player{rank}", scoring_system=systems[0], score=rng.uniform(0, 10000),
+                    blend_count=rng.randint(1, 500), achieved_at=datetime(2025, 1, 1, 12, 34, 56, 789012),
+                    rank=rank
+                )
+                for rank in range(1, 101)
+            ],
+            total_entries=12345
+        )
+    }
+
+
+def _time(fn, arg, iterations: int) -> float:
+    """Best of 3 runs, in microseconds per call"""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with open(DATA) as f:
+        catalog = json.load(f)
+
+    print(f"{'payload':<12} {'format':<8} {'bytes':>8} {'server us':>10} {'client us':>10}")
+    for name, payload in payloads(catalog).items():
+        adapter = TypeAdapter(type(payload))
+        as_json = adapter.dump_json(payload)
+        as_msgpack = msgpack.packb(json.loads(as_json))
+        assert msgpack.unpackb(as_msgpack) == json.loads(as_json)
+
+        json_server = _time(adapter.dump_json, payload, iterations)
+        transcode = _time(lambda body: msgpack.packb(json.loads(body)), as_json, iterations)
+        direct = _time(lambda p: msgpack.packb(adapter.dump_python(p, mode="json")), payload, iterations)
+        print(f"{name:<12} {'json':<8} {len(as_json):>8} {json_server:>10.1f} "
+              f"{_time(json.loads, as_json, iterations):>10.1f}")
+        print(f"{name:<12} {'msgpack':<8} {len(as_msgpack):>8} {json_server + transcode:>10.1f} "
+              f"{_time(msgpack.unpackb, as_msgpack, iterations):>10.1f}")
+        saved = 1 - len(as_msgpack) / len(as_json)
+        print(f"{name:<12} {'':<8} msgpack is {saved:.0%} smaller and costs the server "
+              f"{(json_server + transcode) / json_server:.1f}x the CPU of JSON "
+              f"(packing the data directly: {direct:.1f} us)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark PostgreSQL player name search at scale
+
+Creates a scratch schema (bench_player_search) in the PostgreSQL database
+at DATABASE_URL, fills its player_names table with N generated names (1M by
+default) plus the search indexes, then times player_search's PostgreSQL
+path for 1, 2, 3 and 5 character prefixes and for misspelled names, and
+prints EXPLAIN (ANALYZE, BUFFERS) of the widest prefix and a fuzzy query so
+the rows and pages read can be checked. The schema is dropped afterwards
+unless --keep is given.
+
+Requires PostgreSQL with the pg_trgm extension available.
+
+Usage: python benchmarks/bench_player_search.py [--names 1000000] [--queries 200] [--keep]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from database import DATABASE_URL  # noqa: E402
+from models import PlayerName  # noqa: E402
+from player_search import _search_postgres  # noqa: E402
+
+SCHEMA = "bench_player_search"
+SYLLABLES = [
+    "al", "an", "ar", "ba", "be", "bo", "ca", "da", "de", "el", "en", "fa", "ga", "ha", "il", "ja",
+    "ka", "ki", "la", "le", "li", "lo", "ma", "mi", "mo", "na", "ni", "no", "ra", "ri", "ro", "sa",
+    "se", "sh", "ta", "th", "to", "va", "xi", "ya", "ze", "zo"
+]
+SUFFIXES = ["", "", "", "x", "99", "_gg", "123", "tv", "pro", "2000"]
+
+
+def make_name(rng: random.Random) -> str:
+    name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5))) + rng.choice(SUFFIXES)
+    return name.capitalize() if rng.random() < 0.5 else name
+
+
+def misspell(rng: random.Random, name: str) -> str:
+    """One substitution or adjacent swap, keeping the first letter"""
+    i = rng.randrange(1, len(name) - 1)
+    if rng.random() < 0.5:
+        return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+    return name[:i] + rng.choice("aeiourstln") + name[i + 1:]
+
+
+def populate(engine, count: int, rng: random.Random) -> list:
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA public"))
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        PlayerName.__table__.create(conn)  # With the PostgreSQL search indexes
+
+    names = {make_name(rng) for _ in range(count)}
+    started = time.perf_counter()
+    raw = engine.raw_connection()
+    try:
+        with raw.cursor() as cursor:
+            with cursor.copy("COPY player_names (player_name) FROM STDIN") as copy:
+                for name in names:
+                    copy.write_row((name,))
+        raw.commit()
+    finally:
+        raw.close()
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM ANALYZE player_names"))
+    print(f"loaded {len(names)} names in {time.perf_counter() - started:.1f}s")
+    return sorted(names)
+
+
+def timings(engine, queries, limit: int):
+    samples = []
+    with Session(engine) as db:
+        for query in queries:
+            started = time.perf_counter()
+            _search_postgres(db, query, limit)
+            samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+def explain(engine, sql: str, **params) -> None:
+    with engine.connect() as conn:
+        for line in conn.execute(text("EXPLAIN (ANALYZE, BUFFERS) " + sql), params).scalars():
+            print("    " + line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PostgreSQL player name search")
+    parser.add_argument("--names", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200, help="Queries per category")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--keep", action="store_true", help=f"Keep the {SCHEMA} schema")
+    args = parser.parse_args()
+
+    if not DATABASE_URL.startswith("postgresql"):
+        sys.exit("bench_player_search.py needs a PostgreSQL DATABASE_URL")
+    engine = create_engine(DATABASE_URL, connect_args={"options": f"-csearch_path={SCHEMA},public"})
+    rng = random.Random(7)
+    names = populate(engine, args.names, rng)
+
+    try:
+        sample = rng.sample(names, args.queries)
+        categories = [
+            (f"prefix {length} char{'s' if length > 1 else ''}", [name[:length].lower() for name in sample])
+            for length in (1, 2, 3, 5)
+        ] + [("misspelled name", [misspell(rng, name.lower()) for name in sample if len(name) >= 4])]
+
+        print(f"\n{'query':<20} {'p50 ms':>8} {'p99 ms':>8}   (limit {args.limit}, {len(names)} names)")
+        for label, queries in categories:
+            timings(engine, queries[:10], args.limit)  # Warm up
+            p50, p99 = timings(engine, queries, args.limit)
+            print(f"{label:<20} {p50:>8.2f} {p99:>8.2f}")
+
+        widest = Counter(name[0].lower() for name in names).most_common(1)[0][0]
+        print(f"\nprefix {widest!r}:")
+        explain(
+            engine,
+            'SELECT player_name FROM player_names WHERE lower(player_name) COLLATE "C" LIKE :q '
+            'ORDER BY lower(player_name) COLLATE "C" LIMIT :limit',
+            q=widest + "%", limit=args.limit
+        )
+        typo = misspell(rng, sample[0].lower())
+        print(f"\nfuzzy {typo!r}:")
+        explain(
+            engine,
+            "SELECT player_name FROM player_names WHERE lower(player_name) % :q "
+            "ORDER BY lower(player_name) <-> :q LIMIT :limit",
+            q=typo, limit=args.limit
+        )
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
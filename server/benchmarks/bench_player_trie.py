@@ -0,0 +1,88 @@
+"""
+Benchmark the in-memory player search trie at scale
+
+Builds player_search's PlayerTrie (the backend used on SQLite, or with
+PLAYER_SEARCH_BACKEND=trie) from N generated names (1M by default) and
+reports the build time, the memory it holds, the time to add a refresh's
+worth of new names, and p50/p99 search times for 1, 2, 3 and 5 character
+prefixes, exact names and misspelled names (which take the fuzzy path).
+No database is needed.
+
+Usage: python benchmarks/bench_player_trie.py [--names 1000000] [--queries 500]
+"""
+import argparse
+import gc
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from bench_player_search import make_name, misspell  # noqa: E402
+from player_search import PlayerTrie, _search_trie  # noqa: E402
+
+
+def rss_mb() -> float:
+    """Resident set size of this process (Linux), in MB"""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+
+
+def timings(trie, queries, limit: int):
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        _search_trie(trie, query, limit)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the in-memory player search trie")
+    parser.add_argument("--names", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=500, help="Queries per category")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    unique = set()
+    while len(unique) < args.names:
+        unique.add(make_name(rng))
+    names = list(unique)
+    gc.collect()
+    before = rss_mb()
+    started = time.perf_counter()
+    trie = PlayerTrie().add_all(names)
+    build = time.perf_counter() - started
+    gc.collect()
+    print(f"built {trie.size} names in {build:.2f}s, {rss_mb() - before:.0f} MB")
+
+    fresh = [make_name(rng) + "_new" for _ in range(100)]
+    started = time.perf_counter()
+    trie.add_all(fresh)
+    print(f"refresh adding {len(fresh)} names: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    sample = rng.sample(names, args.queries)
+    categories = [
+        (f"prefix {length} char{'s' if length > 1 else ''}", [name[:length] for name in sample])
+        for length in (1, 2, 3, 5)
+    ] + [
+        ("exact name", sample),
+        ("misspelled name", [misspell(rng, name.lower()) for name in sample if len(name) >= 4]),
+        ("2 typos, 8+ chars", [
+            misspell(rng, misspell(rng, name.lower())) for name in sample if len(name) >= 8
+        ])
+    ]
+
+    print(f"\n{'query':<20} {'p50 ms':>8} {'p99 ms':>8}   (limit {args.limit}, {trie.size} names)")
+    for label, queries in categories:
+        timings(trie, queries[:20], args.limit)  # Warm up
+        p50, p99 = timings(trie, queries, args.limit)
+        print(f"{label:<20} {p50:>8.3f} {p99:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Measure worker cold start and per-worker database load
+
+Each worker used to run the schema check (create_all plus index DDL) when it
+started and query game_objects on every object listing. serve.py now runs
+the schema check once in the parent (workers get SKIP_SCHEMA_CHECK) and
+workers serve listings from the in-process catalog. For both variants this
+starts a fresh interpreter, like a new worker, and reports the time to
+ready and the SQL statements it issued, plus statements per object listing.
+
+Uses DATABASE_URL (a temporary SQLite database with the seed catalog if
+unset).
+
+Usage: python benchmarks/bench_startup.py [runs]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+LISTINGS = 100
+
+
+def child(schema_check: bool) -> None:
+    """Runs in a fresh interpreter; prints one JSON line of measurements"""
+    sys.path.insert(0, SRC_DIR)
+    started = time.perf_counter()  # Imports included, as in a new worker
+    from sqlalchemy import event
+
+    from database import SessionLocal, engine
+    from models import GameObject
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    from catalog import get_catalog
+    from startup import initialize, readiness
+    initializing = time.perf_counter()
+    initialize(skip_schema_check=not schema_check)
+    assert readiness.ready, readiness.detail
+    initialize_seconds = time.perf_counter() - initializing
+    ready_seconds = time.perf_counter() - started
+    startup_statements = len(statements)
+
+    db = SessionLocal()
+    try:
+        del statements[:]
+        for _ in range(LISTINGS):
+            db.query(GameObject).filter(GameObject.unlock_threshold <= 10).all()
+        direct = len(statements) / LISTINGS
+        del statements[:]
+        for _ in range(LISTINGS):
+            get_catalog(db).available(10)
+        cached = len(statements) / LISTINGS
+    finally:
+        db.close()
+
+    print(json.dumps({
+        "ready_seconds": ready_seconds,
+        "initialize_seconds": initialize_seconds,
+        "startup_statements": startup_statements,
+        "listing_statements_direct": direct,
+        "listing_statements_catalog": cached
+    }))
+
+
+def run_child(schema_check: bool, env) -> dict:
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", "check" if schema_check else "skip"],
+        env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    env = dict(os.environ)
+    if not env.get("DATABASE_URL"):
+        path = os.path.join(tempfile.mkdtemp(), "bench_startup.db")
+        env["DATABASE_URL"] = f"sqlite:///{path}"
+        subprocess.run([sys.executable, os.path.join(SRC_DIR, "init_data.py")], env=env, check=True,
+                       capture_output=True, cwd=SRC_DIR)
+
+    results = {}
+    for schema_check in (True, False):
+        samples = [run_child(schema_check, env) for _ in range(runs)]
+        results[schema_check] = {
+            **samples[0],
+            "ready_seconds": min(sample["ready_seconds"] for sample in samples),
+            "initialize_seconds": min(sample["initialize_seconds"] for sample in samples)
+        }
+
+    before, after = results[True], results[False]
+    print(f"runs per variant: {runs} (best time reported)")
+    print(f"{'':<36} {'schema check':>14} {'skipped':>10}")
+    print(f"{'worker time to ready (s)':<36} {before['ready_seconds']:>14.3f} {after['ready_seconds']:>10.3f}")
+    print(f"{'  of which initialize() (s)':<36} {before['initialize_seconds']:>14.3f} "
+          f"{after['initialize_seconds']:>10.3f}")
+    print(f"{'SQL statements at startup':<36} {before['startup_statements']:>14} {after['startup_statements']:>10}")
+    print(f"statements per object listing: {after['listing_statements_direct']:.0f} querying game_objects, "
+          f"{after['listing_statements_catalog']:.0f} from the catalog")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        child(sys.argv[2] == "check")
+    else:
+        main()
@@ -0,0 +1,335 @@
+"""
+Load generator simulating players going through the real game flow
+
+Each virtual player repeatedly plays one session the way the client does:
+new session -> fetch session -> (random offer, think, blend) x N, with
+occasional leaderboard polls -> leaderboard list and view -> maybe submit.
+Players are drawn from a configurable mix of profiles, and the pause between
+steps from a think-time distribution. Latency percentiles and throughput
+are reported per step.
+
+Requires httpx (pip install httpx).
+
+Usage:
+    python benchmarks/loadgen.py --players 1000 --duration 60
+    python benchmarks/loadgen.py --start-server --players 200 --duration 20 --max-error-rate 0.01
+
+--start-server runs serve.py (with the current DATABASE_URL) for the duration
+of the test, with admission control off since every player shares one IP.
+Against another server, expect 429s unless it was started with
+ADMISSION_CONTROL=false or raised IP limits. Rate limited responses are
+reported separately from errors.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional tool dependency
+    sys.exit("loadgen.py requires httpx: pip install httpx")
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+
+@dataclass
+class Profile:
+    """How one kind of player behaves during a session"""
+    blends: Tuple[int, int]  # Blends per session (inclusive range)
+    poll_chance: float  # Chance of a leaderboard poll after each blend
+    submit_chance: float  # Chance of submitting at the end of the session
+
+
+PROFILES: Dict[str, Profile] = {
+    "casual": Profile(blends=(3, 12), poll_chance=0.05, submit_chance=0.3),
+    "grinder": Profile(blends=(20, 60), poll_chance=0.1, submit_chance=0.9),
+    "spectator": Profile(blends=(0, 2), poll_chance=0.8, submit_chance=0.0),
+}
+
+
+def parse_mix(spec: str) -> List[Tuple[str, float]]:
+    """'casual=70,grinder=25,spectator=5' -> [(profile, weight), ...]"""
+    mix = []
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in PROFILES:
+            raise argparse.ArgumentTypeError(f"Unknown profile {name!r} (choose from {', '.join(PROFILES)})")
+        mix.append((name.strip(), float(weight or 1)))
+    return mix
+
+
+def parse_think(spec: str) -> Callable[[random.Random], float]:
+    """
+    Think-time distribution in seconds:
+    const:S, uniform:LO:HI, exp:MEAN or lognormal:MEDIAN:SIGMA
+    """
+    kind, *params = spec.split(":")
+    try:
+        values = [float(p) for p in params]
+        if kind == "const":
+            (seconds,) = values
+            return lambda rng: seconds
+        if kind == "uniform":
+            low, high = values
+            return lambda rng: rng.uniform(low, high)
+        if kind == "exp":
+            (mean,) = values
+            return lambda rng: rng.expovariate(1 / mean) if mean > 0 else 0.0
+        if kind == "lognormal":
+            median, sigma = values
+            return lambda rng: rng.lognormvariate(math.log(median), sigma)
+    except ValueError:
+        pass
+    raise argparse.ArgumentTypeError(f"Invalid think-time distribution {spec!r}")
+
+
+class Stats:
+    """Latencies and outcomes per step"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.rejected: Dict[str, int] = defaultdict(int)
+        self.sessions = 0
+
+    def record(self, step: str, seconds: float, status: Optional[int]) -> None:
+        if status is not None and status < 400:
+            self.latencies[step].append(seconds)
+        elif status in (429, 503):
+            self.rejected[step] += 1
+        else:
+            self.errors[step] += 1
+
+    def total(self, step: str) -> int:
+        return len(self.latencies[step]) + self.errors[step] + self.rejected[step]
+
+    def error_rate(self) -> float:
+        requests = sum(self.total(step) for step in self.steps())
+        return sum(self.errors.values()) / requests if requests else 0.0
+
+    def steps(self) -> List[str]:
+        return sorted(set(self.latencies) | set(self.errors) | set(self.rejected))
+
+    def summary(self, elapsed: float) -> Dict[str, Dict[str, float]]:
+        summary = {}
+        for step in self.steps():
+            samples = sorted(self.latencies[step])
+            summary[step] = {
+                "requests": self.total(step),
+                "ok": len(samples),
+                "errors": self.errors[step],
+                "rejected": self.rejected[step],
+                "rps": self.total(step) / elapsed,
+                "p50_ms": _percentile(samples, 50) * 1000,
+                "p90_ms": _percentile(samples, 90) * 1000,
+                "p99_ms": _percentile(samples, 99) * 1000,
+                "max_ms": (samples[-1] if samples else 0.0) * 1000,
+            }
+        return summary
+
+
+def _percentile(samples: List[float], percent: float) -> float:
+    if not samples:
+        return 0.0
+    index = min(len(samples) - 1, max(0, math.ceil(percent / 100 * len(samples)) - 1))
+    return samples[index]
+
+
+class Player:
+    """One virtual player looping through sessions until the deadline"""
+
+    def __init__(self, number: int, client: httpx.AsyncClient, stats: Stats, profile: Profile,
+                 think: Callable[[random.Random], float], rng: random.Random, deadline: float):
+        self.name = f"loadgen-{number}"
+        self.client = client
+        self.stats = stats
+        self.profile = profile
+        self.think = think
+        self.rng = rng
+        self.deadline = deadline
+
+    async def request(self, step: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.stats.record(step, time.perf_counter() - start, None)
+            return None
+        self.stats.record(step, time.perf_counter() - start, response.status_code)
+        return response
+
+    async def pause(self) -> bool:
+        """Think, unless that would run past the deadline; returns whether to continue"""
+        delay = self.think(self.rng)
+        if time.monotonic() + delay >= self.deadline:
+            return False
+        await asyncio.sleep(delay)
+        return True
+
+    async def run(self) -> None:
+        while time.monotonic() < self.deadline:
+            await self.play_session()
+
+    async def play_session(self) -> None:
+        response = await self.request("new_session", "GET", "/api/scores/new-session")
+        if response is None or response.status_code != 200:
+            await self.pause()
+            return
+        session = response.json()
+        session_id = session["session_id"]
+        token = session.get("session_token")
+        headers = {"X-Session-Token": token} if token else {}
+
+        response = await self.request("get_session", "GET", f"/api/scores/session/{session_id}", headers=headers)
+        if response is None or response.status_code != 200:
+            return
+        blend_count = response.json()["blend_count"]
+        systems: List[str] = []
+
+        for _ in range(self.rng.randint(*self.profile.blends)):
+            response = await self.request("random_objects", "GET", f"/api/objects/random/{blend_count}/3")
+            if response is None or response.status_code != 200 or not await self.pause():
+                return
+            offer = [obj["id"] for obj in response.json()]
+            # First blend takes two objects, later blends one (as in the client)
+            picked = offer[:2] if blend_count == 0 else offer[:1]
+            if len(picked) < (2 if blend_count == 0 else 1):
+                return
+            body = {"session_id": session_id, "object_ids": picked}
+            if token:
+                body["session_token"] = token
+            response = await self.request("blend", "POST", "/api/scores/blend", json=body)
+            if response is None or response.status_code != 200:
+                return
+            result = response.json()
+            blend_count = result["blend_count"]
+            systems = list(result["total_scores"])
+            if result.get("session_token"):
+                token = result["session_token"]
+                headers = {"X-Session-Token": token}
+
+            if systems and self.rng.random() < self.profile.poll_chance:
+                await self.request("leaderboard", "GET", f"/api/leaderboard/{self.rng.choice(systems)}",
+                                   params={"limit": 10})
+
+        response = await self.request("leaderboard_list", "GET", "/api/leaderboard/")
+        if response is not None and response.status_code == 200 and response.json():
+            await self.request("leaderboard", "GET", f"/api/leaderboard/{self.rng.choice(response.json())}")
+
+        if systems and self.rng.random() < self.profile.submit_chance:
+            await self.request("submit", "POST", f"/api/leaderboard/submit/{session_id}",
+                               params={"player_name": self.name}, headers=headers)
+        self.stats.sessions += 1
+        await self.pause()
+
+
+async def run_load(args) -> Tuple[Stats, float]:
+    stats = Stats()
+    rng = random.Random(args.seed)
+    names, weights = zip(*args.mix)
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        start = time.monotonic()
+        deadline = start + args.duration
+
+        async def start_player(number: int):
+            # Spread player arrivals evenly over the ramp-up period
+            await asyncio.sleep(args.ramp_up * number / args.players)
+            profile = PROFILES[rng.choices(names, weights)[0]]
+            player = Player(number, client, stats, profile, args.think,
+                            random.Random(rng.random()), deadline)
+            await player.run()
+
+        await asyncio.gather(*(start_player(number) for number in range(args.players)))
+        elapsed = time.monotonic() - start
+    return stats, elapsed
+
+
+def wait_until_ready(base_url: str, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/ready", timeout=2).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"Server at {base_url} did not become ready within {timeout:.0f}s")
+
+
+def start_server(args) -> subprocess.Popen:
+    port = httpx.URL(args.base_url).port or 5000
+    env = dict(os.environ, ADMISSION_CONTROL="false")
+    server = subprocess.Popen(
+        [sys.executable, "serve.py", "--port", str(port), "--workers", str(args.server_workers), "--init-data"],
+        cwd=SRC_DIR, env=env
+    )
+    try:
+        wait_until_ready(args.base_url)
+    except Exception:
+        server.terminate()
+        raise
+    return server
+
+
+def print_report(stats: Stats, elapsed: float, summary: Dict[str, Dict[str, float]]) -> None:
+    print(f"\n{stats.sessions} sessions in {elapsed:.1f}s")
+    header = f"{'step':<17}{'requests':>9}{'errors':>8}{'429/503':>8}{'req/s':>9}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+    print(header)
+    print("-" * len(header))
+    for step, row in summary.items():
+        print(
+            f"{step:<17}{row['requests']:>9}{row['errors']:>8}{row['rejected']:>8}{row['rps']:>9.1f}"
+            f"{row['p50_ms']:>9.1f}{row['p90_ms']:>9.1f}{row['p99_ms']:>9.1f}{row['max_ms']:>9.1f}"
+        )
+    print(f"\nerror rate: {stats.error_rate():.2%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate players against a Chaos Blender API")
+    parser.add_argument("--base-url", default="http://localhost:5000")
+    parser.add_argument("--players", type=int, default=100, help="Concurrent virtual players")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run")
+    parser.add_argument("--ramp-up", type=float, default=5.0, help="Seconds over which players start")
+    parser.add_argument("--think", type=parse_think, default=parse_think("exp:1.0"),
+                        help="Think time: const:S, uniform:LO:HI, exp:MEAN or lognormal:MEDIAN:SIGMA")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("casual=70,grinder=20,spectator=10"),
+                        help=f"Player mix as profile=weight,... (profiles: {', '.join(PROFILES)})")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout in seconds")
+    parser.add_argument("--max-connections", type=int, default=200)
+    parser.add_argument("--json", help="Also write the per-step summary to this file")
+    parser.add_argument("--max-error-rate", type=float, help="Exit with status 1 above this error rate")
+    parser.add_argument("--start-server", action="store_true",
+                        help="Run serve.py for the test (uses DATABASE_URL from the environment)")
+    parser.add_argument("--server-workers", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    server = start_server(args) if args.start_server else None
+    try:
+        stats, elapsed = asyncio.run(run_load(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    summary = stats.summary(elapsed)
+    print_report(stats, elapsed, summary)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"elapsed": elapsed, "sessions": stats.sessions, "steps": summary}, f, indent=2)
+    if args.max_error_rate is not None and stats.error_rate() > args.max_error_rate:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
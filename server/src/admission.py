@@ -0,0 +1,200 @@
+"""
+Admission control: per-client rate limits and a database concurrency limit
+
+Every /api request takes a token from its client IP's bucket, and routes
+acting on a session also take one from that session's bucket (see
+admit_session). Buckets live in a bounded LRU, so a flood of distinct keys
+evicts the least recently seen ones (which then start over with a full
+bucket) instead of growing memory.
+
+Requests to database-bound routes then wait for one of DB_CONCURRENCY_LIMIT
+slots, so a burst queues in the worker instead of on the connection pool.
+When DB_QUEUE_DEPTH requests are already waiting, or a slot doesn't free up
+within DB_QUEUE_TIMEOUT seconds, the request is rejected at once with a 503.
+Rate limited requests get a 429. Both carry Retry-After.
+
+The client IP is the ASGI client address, which uvicorn only takes from
+X-Forwarded-For for proxies listed in FORWARDED_ALLOW_IPS. Behind any other
+load balancer every request appears to come from the balancer and all
+clients share one bucket.
+"""
+import asyncio
+import math
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Optional
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+from config import settings
+from metrics import Counter, Gauge, registry
+
+# Routes that hold a database connection for most of their duration; object
+# listings are served from the in-process catalog
+DB_BOUND_PREFIXES = ("/api/scores", "/api/leaderboard")
+
+ADMISSION_REJECTED = registry.register(Counter(
+    "chaos_blender_admission_rejected_total",
+    "Requests rejected by admission control",
+    ("reason",)
+))
+
+
+class Rejected(Exception):
+    """Raised when a request is not admitted"""
+
+    def __init__(self, status_code: int, detail: str, retry_after: float):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = max(1, math.ceil(retry_after))
+
+    def headers(self):
+        return {"Retry-After": str(self.retry_after)}
+
+
+class RateLimiter:
+    """Token buckets keyed by client, held in a bounded LRU"""
+
+    def __init__(self, rate: float, burst: int, max_keys: int):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: OrderedDict = OrderedDict()  # key -> (tokens, updated)
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def take(self, key: str) -> Optional[float]:
+        """Take a token for `key`; returns None if allowed, else seconds until one is available"""
+        now = monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return None if allowed else (1 - tokens) / self.rate
+
+
+class ConcurrencyLimiter:
+    """Bounded number of concurrent requests with a bounded wait queue"""
+
+    def __init__(self, limit: int, max_queue: int, timeout: float):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.active = 0
+        self.waiting = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def acquire(self) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.limit)
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                raise Rejected(503, "Server is busy, please retry", 1)
+            self.waiting += 1
+            acquired = False
+            try:
+                # Not wait_for: on Python 3.11 it can time out after the inner
+                # acquire succeeded and lose that permit
+                async with asyncio.timeout(self.timeout):
+                    await self._semaphore.acquire()
+                    acquired = True
+            except TimeoutError:
+                raise Rejected(503, "Server is busy, please retry", self.timeout)
+            except asyncio.CancelledError:
+                # Semaphore.acquire hands back a permit granted just before a
+                # cancel; one that got through is released here
+                if acquired:
+                    self._semaphore.release()
+                raise
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        self.active += 1
+
+    def release(self) -> None:
+        self.active -= 1
+        self._semaphore.release()
+
+
+ip_limiter = RateLimiter(settings.ip_rate_limit, settings.ip_rate_burst, settings.rate_limit_max_keys)
+session_limiter = RateLimiter(
+    settings.session_rate_limit, settings.session_rate_burst, settings.rate_limit_max_keys
+)
+db_limiter = ConcurrencyLimiter(settings.db_concurrency_limit, settings.db_queue_depth, settings.db_queue_timeout)
+
+registry.register(Gauge(
+    "chaos_blender_admission_state",
+    "Admission control state of this worker",
+    ("stat",),
+    callback=lambda: {
+        ("db_active",): db_limiter.active,
+        ("db_waiting",): db_limiter.waiting,
+        ("ip_buckets",): len(ip_limiter),
+        ("session_buckets",): len(session_limiter)
+    }
+))
+
+
+def admit_session(session_id: str) -> None:
+    """Route helper: take a token from the session's bucket or raise a 429"""
+    if not settings.admission_control:
+        return
+    retry_after = session_limiter.take(session_id)
+    if retry_after is not None:
+        ADMISSION_REJECTED.inc(("session_rate",))
+        rejected = Rejected(429, "Too many requests for this session", retry_after)
+        raise HTTPException(status_code=429, detail=rejected.detail, headers=rejected.headers())
+
+
+class AdmissionMiddleware:
+    """Pure ASGI middleware applying the IP rate limit and the database concurrency limit"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if scope["type"] != "http" or not settings.admission_control or not path.startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+
+        if settings.ip_rate_limit > 0:
+            client = scope.get("client")
+            retry_after = ip_limiter.take(client[0] if client else "unknown")
+            if retry_after is not None:
+                ADMISSION_REJECTED.inc(("ip_rate",))
+                await self._reject(Rejected(429, "Too many requests", retry_after), scope, receive, send)
+                return
+
+        if not path.startswith(DB_BOUND_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await db_limiter.acquire()
+        except Rejected as rejected:
+            ADMISSION_REJECTED.inc(("db_busy",))
+            await self._reject(rejected, scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            db_limiter.release()
+
+    @staticmethod
+    async def _reject(rejected: Rejected, scope, receive, send):
+        response = JSONResponse(
+            {"detail": rejected.detail}, status_code=rejected.status_code, headers=rejected.headers()
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,128 @@
+"""
+In-process cache of the game catalog (objects and scoring systems)
+
+The catalog only changes when init_data.py is run, yet every blend, session
+fetch and object listing used to query it. Each worker now keeps an
+immutable snapshot that is loaded once (at startup warmup) and refreshed
+after CATALOG_CACHE_TTL seconds, or as soon as another process publishes a
+"catalog" change (see invalidation.py). Requests that miss while a reload
+is running wait for it instead of loading again, and are counted as shared
+"catalog" calls in the single-flight metrics.
+
+Each snapshot knows the checksum of the catalog file it was loaded from, so
+session tokens can record which catalog their scores were earned under.
+"""
+from bisect import bisect_right
+from threading import Lock
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from config import settings
+from catalog_loader import applied_checksum
+from database import SessionLocal, engine
+from invalidation import on_change
+from metrics import record_cache
+from models import CatalogScores, GameObject, ScoringSystem
+from schemas import GameObjectResponse, ScoringSystemResponse
+from singleflight import record_shared
+
+
+class CatalogSnapshot:
+    """Immutable view of the catalog with lookups used by the routes"""
+
+    def __init__(
+        self,
+        objects: List[GameObjectResponse],
+        systems: List[ScoringSystemResponse],
+        checksum: Optional[str] = None
+    ):
+        # Sorted by unlock threshold so "available at N blends" is a prefix slice
+        self.objects: Tuple[GameObjectResponse, ...] = tuple(
+            sorted(objects, key=lambda obj: (obj.unlock_threshold, obj.id))
+        )
+        self.thresholds: List[int] = [obj.unlock_threshold for obj in self.objects]
+        self.by_id: Dict[int, GameObjectResponse] = {obj.id: obj for obj in self.objects}
+        self.scoring_systems: Tuple[ScoringSystemResponse, ...] = tuple(systems)
+        self.checksum = checksum  # None if the catalog was not applied by catalog_loader
+        self.loaded_at = monotonic()
+
+    def available(self, blend_count: int) -> Tuple[GameObjectResponse, ...]:
+        """Objects with unlock_threshold <= blend_count"""
+        return self.objects[:bisect_right(self.thresholds, blend_count)]
+
+    def unlock_tier(self, blend_count: int) -> Optional[int]:
+        """Highest unlock threshold reached at blend_count (None if nothing is unlocked)"""
+        index = bisect_right(self.thresholds, blend_count)
+        return self.thresholds[index - 1] if index else None
+
+    def unlocked_between(self, previous_count: int, blend_count: int) -> Tuple[GameObjectResponse, ...]:
+        """Objects with previous_count < unlock_threshold <= blend_count"""
+        start = bisect_right(self.thresholds, previous_count)
+        end = bisect_right(self.thresholds, blend_count)
+        return self.objects[start:end]
+
+
+_snapshot: Optional[CatalogSnapshot] = None
+_lock = Lock()
+_version_scores: Dict[str, Dict[int, Dict[str, float]]] = {}  # Earlier catalogs never change
+
+
+def load_catalog(db: Session) -> CatalogSnapshot:
+    """Load a fresh snapshot from the database and make it current"""
+    global _snapshot
+    objects = [GameObjectResponse.model_validate(obj) for obj in db.query(GameObject).all()]
+    systems = [ScoringSystemResponse.model_validate(s) for s in db.query(ScoringSystem).all()]
+    snapshot = CatalogSnapshot(objects, systems, applied_checksum(db))
+    _snapshot = snapshot
+    return snapshot
+
+
+def get_catalog(db: Session) -> CatalogSnapshot:
+    """Return the cached catalog, loading it with the given session if missing or stale"""
+    snapshot = _snapshot
+    if snapshot is not None and monotonic() - snapshot.loaded_at < settings.catalog_cache_ttl:
+        record_cache("catalog", True)
+        return snapshot
+
+    record_cache("catalog", False)
+    with _lock:
+        # Another request may have reloaded while we waited for the lock
+        snapshot = _snapshot
+        fresh = snapshot is not None and monotonic() - snapshot.loaded_at < settings.catalog_cache_ttl
+        record_shared("catalog", fresh)
+        if fresh:
+            return snapshot
+        if db.get_bind() is not engine:
+            # A replica may not have the change that invalidated the snapshot yet
+            with SessionLocal() as primary:
+                return load_catalog(primary)
+        return load_catalog(db)
+
+
+def catalog_scores(db: Session, checksum: Optional[str]) -> Optional[Dict[int, Dict[str, float]]]:
+    """
+    Object id -> scores of the catalog applied as `checksum` (the current one
+    if None), or None if that catalog was never recorded
+    """
+    catalog = get_catalog(db)
+    if not checksum or checksum == catalog.checksum:
+        return {object_id: obj.scores for object_id, obj in catalog.by_id.items()}
+    if checksum not in _version_scores:
+        row = db.get(CatalogScores, checksum)
+        if row is None:
+            return None
+        _version_scores[checksum] = {
+            int(object_id): scores for object_id, scores in row.object_scores.items()
+        }
+    return _version_scores[checksum]
+
+
+def invalidate_catalog() -> None:
+    """Drop the cached snapshot so the next request reloads it"""
+    global _snapshot
+    _snapshot = None
+
+
+on_change("catalog", invalidate_catalog)
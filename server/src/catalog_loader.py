@@ -0,0 +1,203 @@
+"""
+Bulk loader for catalog tables (game_objects, scoring_systems)
+
+The catalog lives in data/catalog.json. Its checksum is recorded in
+catalog_versions each time it is applied, so a sync with an unchanged file
+costs one indexed lookup. Otherwise rows are keyed on their unique `name`:
+the current table contents are read in one SELECT, diffed in Python, and
+every new or changed row is written with a single
+INSERT ... ON CONFLICT (name) DO UPDATE statement.
+"""
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from database import insert_for
+from invalidation import publish
+from models import CatalogScores, CatalogVersion, GameObject, ScoringSystem
+
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "catalog.json")
+
+
+@dataclass
+class LoadResult:
+    """Outcome of loading one table"""
+    table: str
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+    def __str__(self):
+        text = (
+            f"{self.table}: {self.inserted} inserted, {self.updated} updated, "
+            f"{self.unchanged} unchanged"
+        )
+        return text + (f", {self.removed} removed" if self.removed else "")
+
+
+@dataclass
+class SyncReport:
+    """Outcome of syncing the catalog file"""
+    checksum: str
+    skipped: bool = False
+    results: List[LoadResult] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return any(r.inserted or r.updated or r.removed for r in self.results)
+
+    def __str__(self):
+        if self.skipped:
+            return f"catalog {self.checksum[:12]} already applied, skipped"
+        return "; ".join(str(r) for r in self.results)
+
+
+def _normalize(table, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Give every row the same keys (multi-row VALUES needs them), using column defaults"""
+    columns = set().union(*rows)
+    defaults = {}
+    for name in columns:
+        default = table.c[name].default
+        defaults[name] = default.arg if default is not None and default.is_scalar else None
+    return [{name: row.get(name, defaults[name]) for name in columns} for row in rows]
+
+
+def upsert_rows(
+    db: Session,
+    model,
+    rows: List[Dict[str, Any]],
+    key: str = "name",
+    prune: bool = False
+) -> LoadResult:
+    """
+    Insert new rows and update changed rows of `model`, matched on `key`.
+    With prune=True, rows whose key is not in `rows` are deleted.
+    """
+    table = model.__table__
+    result = LoadResult(table.name)
+    if not rows:
+        return result
+
+    rows = _normalize(table, rows)
+    columns = sorted(rows[0])
+
+    existing = {
+        row[0]: row[1:]
+        for row in db.execute(select(table.c[key], *(table.c[name] for name in columns)))
+    }
+
+    pending = []
+    for row in rows:
+        current = existing.get(row[key])
+        if current is None:
+            result.inserted += 1
+            pending.append(row)
+        elif tuple(current) != tuple(row[name] for name in columns):
+            result.updated += 1
+            pending.append(row)
+        else:
+            result.unchanged += 1
+
+    if pending:
+        stmt = insert_for(table, db.get_bind()).values(pending)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c[key]],
+            set_={name: stmt.excluded[name] for name in columns if name != key}
+        )
+        db.execute(stmt)
+
+    stale = set(existing) - {row[key] for row in rows}
+    if prune and stale:
+        db.execute(delete(table).where(table.c[key].in_(stale)))
+        result.removed = len(stale)
+
+    return result
+
+
+def read_sprite_aliases(path: Optional[str]) -> Dict[str, str]:
+    """
+    Load the sprite alias map written by create_sprites.py. An empty path
+    disables aliasing; a configured file that is missing raises, since
+    syncing without it would silently revert every sprite_path.
+    """
+    if not path:
+        return {}
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"Sprite alias map not found: {path} (set SPRITE_ALIAS_PATH='' to keep the catalog's paths)"
+        )
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def read_catalog_file(
+    path: str = DEFAULT_CATALOG_PATH,
+    aliases: Optional[Dict[str, str]] = None
+) -> Tuple[Dict[str, List[dict]], str]:
+    """
+    Load the catalog data file and return it with its checksum.
+    Sprite paths found in `aliases` are rewritten to their content-addressed
+    file; the checksum covers the rewritten data so alias changes get synced.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if aliases:
+        for obj in data["game_objects"]:
+            obj["sprite_path"] = aliases.get(obj["sprite_path"], obj["sprite_path"])
+    # Hash a canonical encoding so reformatting the file doesn't trigger a sync
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return data, hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def applied_checksum(db: Session) -> Optional[str]:
+    """Checksum of the most recently applied catalog, if any"""
+    return db.execute(
+        select(CatalogVersion.checksum).order_by(CatalogVersion.id.desc()).limit(1)
+    ).scalar()
+
+
+def record_scores(db: Session, checksum: str) -> None:
+    """Keep the object scores applied under `checksum` (see tokens.py)"""
+    if db.get(CatalogScores, checksum) is not None:
+        return
+    object_scores = {
+        str(object_id): scores
+        for object_id, scores in db.execute(select(GameObject.id, GameObject.scores))
+    }
+    db.add(CatalogScores(checksum=checksum, object_scores=object_scores))
+
+
+def sync_catalog(
+    db: Session,
+    path: str = DEFAULT_CATALOG_PATH,
+    force: bool = False,
+    prune: bool = False,
+    aliases_path: Optional[str] = None
+) -> SyncReport:
+    """
+    Apply the catalog file to the database unless its checksum matches the
+    last applied version. The caller commits.
+    """
+    data, checksum = read_catalog_file(path, read_sprite_aliases(aliases_path))
+    report = SyncReport(checksum)
+
+    if not force and applied_checksum(db) == checksum:
+        report.skipped = True
+        # Databases synced before catalog_scores existed get it on their next sync
+        record_scores(db, checksum)
+        return report
+
+    report.results.append(upsert_rows(db, ScoringSystem, data["scoring_systems"], prune=prune))
+    report.results.append(upsert_rows(db, GameObject, data["game_objects"], prune=prune))
+    db.add(CatalogVersion(checksum=checksum, summary=str(report)))
+    record_scores(db, checksum)
+    if report.changed:
+        # Running workers drop their cached catalog once this commits
+        publish(db, "catalog")
+    return report
@@ -0,0 +1,95 @@
+"""
+Application settings loaded from environment variables and .env
+"""
+import os
+import tempfile
+
+from pydantic import model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+SPRITES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "client", "public", "sprites"
+)
+
+
+class Settings(BaseSettings):
+    """Runtime settings; each field maps to an upper-case environment variable"""
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    # Server
+    host: str = "0.0.0.0"
+    port: int = 5000
+    reload: bool = False  # Development only
+    web_concurrency: int = 0  # Worker processes for serve.py; 0 = one per CPU
+    # Proxies whose X-Forwarded-For is trusted for the client IP (comma-separated IPs/networks, or "*")
+    forwarded_allow_ips: str = "127.0.0.1"
+
+    # Startup
+    skip_schema_check: bool = False  # Set when the schema is managed elsewhere (e.g. serve.py)
+    startup_retry_interval: float = 2.0  # Seconds between database connection attempts
+    startup_max_retry_interval: float = 60.0  # Backoff cap when startup fails after connecting
+
+    # Caching
+    catalog_cache_ttl: float = 300.0  # Seconds before the in-process catalog is reloaded
+
+    # Sprite sheet manifest and alias map written by create_sprites.py
+    sprite_manifest_path: str = os.path.join(SPRITES_DIR, "sprite-manifest.json")
+    sprite_alias_path: str = os.path.join(SPRITES_DIR, "sprite-aliases.json")  # Empty to disable
+
+    # Cross-worker invalidation (see invalidation.py)
+    cache_listen: bool = True  # LISTEN for change notifications (PostgreSQL only)
+    cache_poll_interval: float = 5.0  # Seconds between version polls when not listening
+
+    # Read replica (DATABASE_READ_URL); reads fall back to the primary beyond this lag
+    max_replica_lag: float = 5.0  # Seconds; also how long a session's reads stay on the primary after a write
+    replica_check_interval: float = 5.0  # Seconds between replica lag checks
+
+    # Stateless sessions (see tokens.py); the secret must be the same for every worker
+    session_tokens: bool = False
+    session_token_secret: str = ""
+
+    # Admission control (see admission.py)
+    admission_control: bool = True
+    # Requests per second per client IP; 0 = off. Only enable once FORWARDED_ALLOW_IPS
+    # covers the proxies in front of the API, or every client shares one bucket
+    ip_rate_limit: float = 0.0
+    ip_rate_burst: int = 40
+    session_rate_limit: float = 5.0  # Blends/submits per second per session
+    session_rate_burst: int = 10
+    rate_limit_max_keys: int = 10000  # IPs/sessions tracked per worker
+    db_concurrency_limit: int = 15  # Concurrent database-bound requests per worker (pool size + overflow)
+    db_queue_depth: int = 50  # Requests allowed to wait for a slot before rejecting with 503
+    db_queue_timeout: float = 2.0  # Seconds a request may wait for a slot
+
+    # On-demand request profiling (see profiling.py); disabled unless a token is set
+    profiling_token: str = ""
+    profile_dir: str = os.path.join(tempfile.gettempdir(), "chaos-blender-profiles")
+    profile_keep: int = 50  # Most recent profiles kept on disk
+    profile_sample_interval: float = 0.001  # Seconds between stack samples in "sample" mode
+
+    # Object offers: "random" (a fresh draw per request) or "daily_shop" (see offers.py)
+    offer_mode: str = "random"
+    offer_bucket_seconds: int = 86400  # Length of a shop period, aligned to the epoch (UTC)
+    offer_seed: str = "chaos-blender"  # Change to reshuffle every shop
+
+    # Player search: "auto" (pg_trgm on PostgreSQL, in-memory trie otherwise), "trigram" or "trie"
+    player_search_backend: str = "auto"
+    player_search_refresh_interval: float = 5.0  # Seconds between trie refreshes (new names show up after this)
+
+    # Background maintenance (see maintenance.py)
+    background_jobs: bool = True
+    leaderboard_rolloff_interval: float = 300.0  # Seconds between expired window clean-ups
+    session_ttl_days: float = 30.0  # Sessions idle for longer are expired
+    session_archive: bool = True  # Copy expired sessions to player_scores_archive instead of only deleting
+    session_expiry_interval: float = 3600.0  # Seconds between session expiry runs
+    session_expiry_batch_size: int = 1000  # Rows per expiry transaction
+
+    @model_validator(mode="after")
+    def _check_session_tokens(self):
+        # Fail at startup rather than with a 500 on every request
+        if self.session_tokens and not self.session_token_secret:
+            raise ValueError("SESSION_TOKEN_SECRET must be set when SESSION_TOKENS is enabled")
+        return self
+
+
+settings = Settings()
@@ -0,0 +1,136 @@
+"""
+Cross-worker cache invalidation
+
+Writers call publish(db, scope) inside their transaction. That bumps the
+scope's row in cache_versions and, on PostgreSQL, sends
+NOTIFY chaos_blender_cache '<scope>:<version>', which is delivered when the
+transaction commits.
+
+Every worker runs run_listener() in the background. It LISTENs on the
+channel and runs the handlers registered for the changed scope only. If the
+listener connection drops (or the database is not PostgreSQL) it falls back
+to polling cache_versions every CACHE_POLL_INTERVAL seconds, and polls once
+after each reconnect to catch anything missed in between.
+"""
+import asyncio
+import logging
+from typing import Callable, Dict, List
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from config import settings
+from database import SessionLocal, engine, insert_for
+from metrics import Counter, registry
+from models import CacheVersion
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "chaos_blender_cache"
+
+INVALIDATIONS = registry.register(Counter(
+    "chaos_blender_cache_invalidations_total",
+    "Cache invalidations applied by scope and how the change was detected",
+    ("scope", "source")
+))
+
+_handlers: Dict[str, List[Callable[[], None]]] = {}
+_known_versions: Dict[str, int] = {}
+
+
+def on_change(scope: str, handler: Callable[[], None]) -> None:
+    """Register a callback to run in this worker when `scope` changes"""
+    _handlers.setdefault(scope, []).append(handler)
+
+
+def publish(db: Session, scope: str) -> int:
+    """
+    Bump the version of `scope` and notify other workers on commit.
+    Returns the new version. The caller commits.
+    """
+    table = CacheVersion.__table__
+    stmt = insert_for(table, db.get_bind()).values(scope=scope, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.scope],
+        set_={"version": table.c.version + 1, "updated_at": func.now()}
+    ).returning(table.c.version)
+    version = db.execute(stmt).scalar_one()
+
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(select(func.pg_notify(CHANNEL, f"{scope}:{version}")))
+    return version
+
+
+def _apply(scope: str, version: int, source: str) -> None:
+    if version <= _known_versions.get(scope, 0):
+        return
+    _known_versions[scope] = version
+    for handler in _handlers.get(scope, ()):
+        try:
+            handler()
+        except Exception:
+            logger.exception("Cache invalidation handler for %r failed", scope)
+    INVALIDATIONS.inc((scope, source))
+
+
+def poll(fire: bool = True) -> None:
+    """Compare cache_versions with the versions this worker has seen"""
+    db = SessionLocal()
+    try:
+        rows = db.execute(select(CacheVersion.scope, CacheVersion.version)).all()
+    finally:
+        db.close()
+    for scope, version in rows:
+        if fire:
+            _apply(scope, version, "poll")
+        else:
+            _known_versions[scope] = max(version, _known_versions.get(scope, 0))
+
+
+def _handle_notification(payload: str) -> None:
+    scope, _, version = payload.rpartition(":")
+    try:
+        _apply(scope, int(version), "notify")
+    except ValueError:
+        logger.warning("Ignoring malformed cache notification %r", payload)
+
+
+async def _listen(stop: asyncio.Event) -> None:
+    import psycopg
+
+    url = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+    async with await psycopg.AsyncConnection.connect(url, autocommit=True) as conn:
+        await conn.execute(f"LISTEN {CHANNEL}")
+        logger.info("Listening for cache invalidations on %s", CHANNEL)
+        # Catch up on changes published while we were not listening
+        await asyncio.to_thread(poll)
+        while not stop.is_set():
+            # The timeout lets the loop notice shutdown between notifications
+            async for notify in conn.notifies(timeout=settings.cache_poll_interval):
+                _handle_notification(notify.payload)
+
+
+async def run_listener(stop: asyncio.Event) -> None:
+    """Background task: listen for notifications, polling whenever that isn't possible"""
+    listen = settings.cache_listen and engine.dialect.name == "postgresql"
+    try:
+        await asyncio.to_thread(poll, False)
+    except Exception:
+        logger.exception("Initial cache version poll failed")
+
+    while not stop.is_set():
+        if listen:
+            try:
+                await _listen(stop)
+                continue
+            except Exception as e:
+                logger.warning("Cache listener disconnected, polling instead: %s", e)
+
+        try:
+            await asyncio.to_thread(poll)
+        except Exception as e:
+            logger.warning("Cache version poll failed: %s", e)
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=settings.cache_poll_interval)
+        except asyncio.TimeoutError:
+            pass
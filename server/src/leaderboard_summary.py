@@ -0,0 +1,64 @@
+"""
+Per scoring system leaderboard summaries (entries, players, max, min, last updated)
+
+record_summary() is one upsert per submitted entry; rebuild() recomputes
+the table from the leaderboard and player_bests. The row for a system is
+locked only for the duration of the submitting transaction, so concurrent
+submits to the same system serialize on that row rather than racing on a
+COUNT. Submits must record their systems in sorted order, so that two of
+them always lock shared rows in the same order and can't deadlock.
+"""
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.orm import Session
+
+from database import insert_for
+from models import Leaderboard, LeaderboardSummary, PlayerBest
+
+
+def record_summary(db: Session, entry: Leaderboard, new_player: bool) -> None:
+    """Count the entry (and its player, if new) and widen the score range of its scoring system"""
+    table = LeaderboardSummary.__table__
+    stmt = insert_for(table, db.get_bind()).values(
+        scoring_system=entry.scoring_system,
+        entry_count=1,
+        player_count=int(new_player),
+        max_score=entry.score,
+        min_score=entry.score
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.scoring_system],
+        set_={
+            "entry_count": table.c.entry_count + 1,
+            "player_count": table.c.player_count + int(new_player),
+            # CASE rather than GREATEST/LEAST so this also runs on SQLite
+            "max_score": case((stmt.excluded.max_score > table.c.max_score, stmt.excluded.max_score),
+                              else_=table.c.max_score),
+            "min_score": case((stmt.excluded.min_score < table.c.min_score, stmt.excluded.min_score),
+                              else_=table.c.min_score),
+            "updated_at": func.now()
+        }
+    )
+    db.execute(stmt)
+
+
+def rebuild(db: Session) -> int:
+    """
+    Recompute leaderboard_summaries from the leaderboard and player_bests
+    (rebuild player_bests first). The caller commits.
+    """
+    players = select(func.count()).where(
+        PlayerBest.scoring_system == Leaderboard.scoring_system
+    ).correlate(Leaderboard).scalar_subquery()
+    db.execute(delete(LeaderboardSummary))
+    result = db.execute(LeaderboardSummary.__table__.insert().from_select(
+        ["scoring_system", "entry_count", "player_count", "max_score", "min_score", "updated_at"],
+        select(
+            Leaderboard.scoring_system,
+            func.count(),
+            players,
+            func.max(Leaderboard.score),
+            func.min(Leaderboard.score),
+            func.max(Leaderboard.achieved_at)
+        ).group_by(Leaderboard.scoring_system)
+    ))
+    return result.rowcount
@@ -0,0 +1,112 @@
+"""
+Time-windowed (daily / weekly) leaderboards
+
+Every submission is also written to leaderboard_windows for the current
+daily and weekly window. Reads select one board by (window, scoring system,
+window start), the same indexed top-N as the all-time board, and
+roll_off() deletes rows of ended windows in the background instead of
+filtering by achieved_at at query time. Each board's entry count is kept in
+leaderboard_window_counts, so totals don't count the board's rows.
+"""
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from database import insert_for
+from models import Leaderboard, LeaderboardWindowCount, LeaderboardWindowEntry
+
+WINDOWS = ("daily", "weekly")
+
+
+def window_start(window: str, now: Optional[datetime] = None) -> date:
+    """First UTC day of the window containing `now`"""
+    today = (now or datetime.now(timezone.utc)).astimezone(timezone.utc).date()
+    if window == "daily":
+        return today
+    if window == "weekly":
+        return today - timedelta(days=today.weekday())
+    raise ValueError(f"Unknown leaderboard window {window!r}")
+
+
+def record_entry(db: Session, entry: Leaderboard, now: Optional[datetime] = None) -> None:
+    """Add a new leaderboard entry to the current board of every window, and count it"""
+    table = LeaderboardWindowCount.__table__
+    for window in WINDOWS:
+        start = window_start(window, now)
+        db.add(LeaderboardWindowEntry(
+            window=window,
+            window_start=start,
+            player_name=entry.player_name,
+            scoring_system=entry.scoring_system,
+            score=entry.score,
+            blend_count=entry.blend_count,
+            session_id=entry.session_id
+        ))
+        stmt = insert_for(table, db.get_bind()).values(
+            window=window, window_start=start, scoring_system=entry.scoring_system, entry_count=1
+        )
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[table.c.window, table.c.window_start, table.c.scoring_system],
+            set_={"entry_count": table.c.entry_count + 1}
+        ))
+
+
+def board_count(db: Session, window: str, scoring_system: str, now: Optional[datetime] = None) -> int:
+    """Entries on the current board of a window"""
+    return db.execute(
+        select(LeaderboardWindowCount.entry_count).where(
+            LeaderboardWindowCount.window == window,
+            LeaderboardWindowCount.window_start == window_start(window, now),
+            LeaderboardWindowCount.scoring_system == scoring_system
+        )
+    ).scalar() or 0
+
+
+def roll_off(db: Session, batch_size: int = 1000, now: Optional[datetime] = None) -> int:
+    """
+    Delete entries of windows that have ended, in batches of `batch_size`
+    with a commit after each so no long-running lock is held. Returns the
+    number of rows deleted.
+    """
+    deleted = 0
+    for window in WINDOWS:
+        current = window_start(window, now)
+        while True:
+            ids = db.execute(
+                select(LeaderboardWindowEntry.id).where(
+                    LeaderboardWindowEntry.window == window,
+                    LeaderboardWindowEntry.window_start < current
+                ).limit(batch_size)
+            ).scalars().all()
+            if not ids:
+                break
+            db.execute(delete(LeaderboardWindowEntry).where(LeaderboardWindowEntry.id.in_(ids)))
+            db.commit()
+            deleted += len(ids)
+        db.execute(delete(LeaderboardWindowCount).where(
+            LeaderboardWindowCount.window == window,
+            LeaderboardWindowCount.window_start < current
+        ))
+        db.commit()
+    return deleted
+
+
+def rebuild_counts(db: Session) -> int:
+    """Recompute leaderboard_window_counts from leaderboard_windows. The caller commits."""
+    db.execute(delete(LeaderboardWindowCount))
+    result = db.execute(LeaderboardWindowCount.__table__.insert().from_select(
+        ["window", "window_start", "scoring_system", "entry_count"],
+        select(
+            LeaderboardWindowEntry.window,
+            LeaderboardWindowEntry.window_start,
+            LeaderboardWindowEntry.scoring_system,
+            func.count()
+        ).group_by(
+            LeaderboardWindowEntry.window,
+            LeaderboardWindowEntry.window_start,
+            LeaderboardWindowEntry.scoring_system
+        )
+    ))
+    return result.rowcount
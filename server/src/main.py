@@ -1,27 +1,87 @@
 """
 Main FastAPI application for Chaos Blender backend
 """
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
-import os
+import asyncio
+import logging
 
 from routes import objects, scores, leaderboard
-from database import engine, Base
+from config import settings
+from database import engine, read_engine
+from invalidation import run_listener
+from maintenance import run_maintenance
+from admission import AdmissionMiddleware
+from negotiation import MsgPackMiddleware
+from metrics import CONTENT_TYPE, MetricsMiddleware, register_router, registry
+from profiling import ProfilingMiddleware, router as profiling_router
+from startup import initialize, readiness
 
 # Load environment variables
 load_dotenv()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Initialize in the background so the worker starts serving /health at once;
+    /ready reports 503 until the database is reachable and caches are warm.
+    Afterwards the same task listens for cache invalidations from other workers
+    and runs periodic maintenance. A failed startup (e.g. a schema error) is
+    logged and retried with backoff.
+    """
+    stop = asyncio.Event()
+
+    async def background():
+        delay = settings.startup_retry_interval
+        while not stop.is_set():
+            try:
+                await run_in_threadpool(initialize)
+                break
+            except Exception:
+                logger.exception("Startup failed, retrying in %.1fs", delay)
+                readiness.set(False, "startup failed, retrying")
+                try:
+                    await asyncio.wait_for(stop.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                delay = min(delay * 2, settings.startup_max_retry_interval)
+        if readiness.ready:
+            await asyncio.gather(run_listener(stop), run_maintenance(stop))
+
+    task = asyncio.create_task(background())
+    yield
+    readiness.set(False, "shutting down")
+    readiness.stopping.set()
+    stop.set()
+    await asyncio.gather(task, return_exceptions=True)
+    engine.dispose()
+    read_engine.dispose()
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Chaos Blender API",
     description="Backend API for the Chaos Blender game",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# Rate limits and DB concurrency limit (innermost, so rejections still get
+# CORS headers and are counted in metrics)
+app.add_middleware(AdmissionMiddleware)
+
+# MessagePack for clients that ask for it (outside admission control, so
+# its rejections are encoded too)
+app.add_middleware(MsgPackMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -29,12 +89,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Last-Write"],  # Read-your-writes marker (see database.py)
 )
 
+# Per-request profiling, only installed when a token is configured
+if settings.profiling_token:
+    app.add_middleware(ProfilingMiddleware)
+    app.include_router(profiling_router, tags=["debug"])
+
+# Record per-route latency for /metrics (added last so it wraps everything)
+app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(objects.router, prefix="/api/objects", tags=["objects"])
 app.include_router(scores.router, prefix="/api/scores", tags=["scores"])
 app.include_router(leaderboard.router, prefix="/api/leaderboard", tags=["leaderboard"])
+register_router(objects.router, "/api/objects")
+register_router(scores.router, "/api/scores")
+register_router(leaderboard.router, "/api/leaderboard")
 
 
 @app.get("/")
@@ -49,8 +121,27 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness check: 503 until startup has finished"""
+    if not readiness.ready:
+        return JSONResponse(status_code=503, content={"status": readiness.detail})
+    return {"status": "ready"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint"""
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
+
+
 if __name__ == "__main__":
+    # Development entry point; use serve.py in production
     import uvicorn
-    port = int(os.getenv("PORT", 5000))
-    host = os.getenv("HOST", "0.0.0.0")
-    uvicorn.run("main:app", host=host, port=port, reload=True)
+    uvicorn.run(
+        "main:app",
+        host=settings.host,
+        port=settings.port,
+        reload=settings.reload,
+        forwarded_allow_ips=settings.forwarded_allow_ips
+    )
@@ -0,0 +1,61 @@
+"""
+Periodic background maintenance run by each API worker
+
+Jobs are plain functions taking a database session; they run in a thread
+so they don't block the event loop. All jobs are idempotent, so it is safe
+for every worker to run them.
+"""
+import asyncio
+import logging
+from typing import Callable, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from config import settings
+from database import SessionLocal
+from leaderboard_windows import roll_off
+from replication import check_replica, replica_enabled
+from sessions import expire_sessions
+
+logger = logging.getLogger(__name__)
+
+
+def _run_job(name: str, job: Callable[[Session], object]) -> None:
+    db = SessionLocal()
+    try:
+        result = job(db)
+        db.commit()
+        if result:
+            logger.info("Maintenance job %s: %s", name, result)
+    except Exception:
+        db.rollback()
+        logger.exception("Maintenance job %s failed", name)
+    finally:
+        db.close()
+
+
+async def _every(stop: asyncio.Event, interval: float, name: str, job: Callable[[Session], object]) -> None:
+    while not stop.is_set():
+        await asyncio.to_thread(_run_job, name, job)
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+def jobs() -> List[Tuple[str, float, Callable[[Session], object]]]:
+    """(name, interval in seconds, job) for every enabled maintenance job"""
+    enabled = [
+        ("leaderboard_window_rolloff", settings.leaderboard_rolloff_interval, roll_off),
+        ("session_expiry", settings.session_expiry_interval, expire_sessions),
+    ]
+    if replica_enabled():
+        enabled.append(("replica_lag_check", settings.replica_check_interval, check_replica))
+    return enabled
+
+
+async def run_maintenance(stop: asyncio.Event) -> None:
+    """Background task: run every maintenance job on its interval until stopped"""
+    if not settings.background_jobs:
+        return
+    await asyncio.gather(*(_every(stop, interval, name, job) for name, interval, job in jobs()))
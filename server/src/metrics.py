@@ -0,0 +1,344 @@
+"""
+Prometheus-format metrics for Chaos Blender
+
+A tiny in-process registry (no client library needed) plus an ASGI middleware
+that records per-route latency, and SQLAlchemy hooks that record query
+counts, durations and connection pool usage. Rendered by GET /metrics.
+"""
+from bisect import bisect_left
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets in seconds, tuned for an API whose requests are mostly 1-100ms
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """Base class for a named metric family with optional labels"""
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = Lock()
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+
+
+class Counter(Metric):
+    """Monotonically increasing counter"""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def get(self, labels: LabelValues = ()) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in items
+        ]
+
+
+class Gauge(Metric):
+    """
+    Value that can go up and down.
+    If a callback is given it is evaluated at scrape time and must return
+    a mapping of label values to numbers.
+    """
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback = callback
+
+    def set(self, value: float, labels: LabelValues = ()) -> None:
+        self._values[labels] = value
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        self.inc(labels, -amount)
+
+    def samples(self) -> List[str]:
+        values = self._callback() if self._callback else self._values
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(values.items())
+        ]
+
+
+class Histogram(Metric):
+    """Cumulative histogram with fixed bucket bounds"""
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._bounds = tuple(sorted(buckets))
+        # labels -> [bucket counts..., +Inf count, sum]
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self._bounds) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, labels: LabelValues = ()) -> int:
+        series = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((labels, list(series)) for labels, series in self._series.items())
+        lines = []
+        for labels, series in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self._bounds + (float("inf"),), series[:-1]):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}"
+                )
+            label_str = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{label_str} {cumulative}")
+        return lines
+
+
+class Registry:
+    """Collection of metrics rendered together in the text exposition format"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+REQUEST_LATENCY = registry.register(Histogram(
+    "chaos_blender_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route")
+))
+REQUESTS_TOTAL = registry.register(Counter(
+    "chaos_blender_requests_total",
+    "HTTP requests by route template and status code",
+    ("method", "route", "status")
+))
+REQUESTS_IN_FLIGHT = registry.register(Gauge(
+    "chaos_blender_requests_in_flight",
+    "HTTP requests currently being served"
+))
+DB_QUERY_DURATION = registry.register(Histogram(
+    "chaos_blender_db_query_duration_seconds",
+    "Database statement execution time by statement type and outcome (ok or error)",
+    ("operation", "outcome")
+))
+CACHE_REQUESTS = registry.register(Counter(
+    "chaos_blender_cache_requests_total",
+    "In-process cache lookups by cache name and result",
+    ("cache", "result")
+))
+
+
+def _cache_hit_ratios() -> Dict[LabelValues, float]:
+    totals: Dict[str, List[float]] = {}
+    with CACHE_REQUESTS._lock:
+        items = list(CACHE_REQUESTS._values.items())
+    for (cache, result), value in items:
+        hits_and_total = totals.setdefault(cache, [0.0, 0.0])
+        if result == "hit":
+            hits_and_total[0] += value
+        hits_and_total[1] += value
+    return {(cache,): hits / total for cache, (hits, total) in totals.items() if total}
+
+
+registry.register(Gauge(
+    "chaos_blender_cache_hit_ratio",
+    "Fraction of cache lookups served from cache",
+    ("cache",),
+    callback=_cache_hit_ratios
+))
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Record a lookup against a named in-process cache"""
+    CACHE_REQUESTS.inc((cache, "hit" if hit else "miss"))
+
+
+_pools: Dict[str, object] = {}
+
+# id(route) -> full path template, for routers mounted under a prefix
+_route_templates: Dict[int, str] = {}
+
+
+def _pool_stats() -> Dict[LabelValues, float]:
+    stats = {}
+    for name, pool in _pools.items():
+        for stat in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(pool, stat, None)
+            if method is not None:
+                stats[(name, stat)] = method()
+    return stats
+
+
+registry.register(Gauge(
+    "chaos_blender_db_pool",
+    "Connection pool statistics per engine",
+    ("engine", "stat"),
+    callback=_pool_stats
+))
+
+
+def register_router(router, prefix: str) -> None:
+    """
+    Remember the full path template of every route in an included router.
+    Depending on the FastAPI version the matched route in the scope may be the
+    router's original route object, whose path does not include the prefix.
+    """
+    for route in router.routes:
+        path = getattr(route, "path", None)
+        if path is not None:
+            _route_templates[id(route)] = prefix + path
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording latency and status per route template.
+
+    The route template (e.g. /api/scores/session/{session_id}) is read from
+    the scope after routing, so label cardinality stays bounded no matter
+    how many distinct URLs are requested.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = perf_counter() - start
+            REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            template = (
+                _route_templates.get(id(route)) or getattr(route, "path", None) or "unmatched"
+            )
+            method = scope["method"]
+            REQUEST_LATENCY.observe(elapsed, (method, template))
+            REQUESTS_TOTAL.inc((method, template, str(status)))
+
+
+def _operation(statement: str) -> str:
+    verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return verb if verb in ("SELECT", "INSERT", "UPDATE", "DELETE") else "OTHER"
+
+
+def instrument_engine(engine: Engine, name: str = "primary") -> None:
+    """Attach query timing hooks and pool gauges to a SQLAlchemy engine"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info["query_start_time"].pop()
+        DB_QUERY_DURATION.observe(perf_counter() - start, (_operation(statement), "ok"))
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(context):
+        # after_cursor_execute doesn't run for failed statements; pop their
+        # start time here so it doesn't pile up on the pooled connection
+        conn = context.connection
+        if conn is None or context.statement is None or not conn.info.get("query_start_time"):
+            return
+        start = conn.info["query_start_time"].pop()
+        DB_QUERY_DURATION.observe(perf_counter() - start, (_operation(context.statement), "error"))
+
+    _pools[name] = engine.pool
@@ -1,7 +1,7 @@
 """
 SQLAlchemy models for Chaos Blender
 """
-from sqlalchemy import Column, Integer, String, Float, Boolean, JSON, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Boolean, JSON, Date, DateTime, ForeignKey, Index, DDL, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -65,16 +65,178 @@ class PlayerScore(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
 
+# Session expiry scans by last activity (updated_at is NULL until the first update)
+Index(
+    "ix_player_scores_last_active",
+    func.coalesce(PlayerScore.updated_at, PlayerScore.created_at)
+)
+
+
+class PlayerScoreArchive(Base):
+    """Expired player sessions moved out of player_scores (see sessions.py)"""
+    __tablename__ = "player_scores_archive"
+
+    id = Column(Integer, primary_key=True)
+    player_name = Column(String, nullable=False)
+    session_id = Column(String, nullable=False)
+    blend_count = Column(Integer, default=0)
+    scores = Column(JSON, nullable=False)
+    blended_objects = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class Leaderboard(Base):
     """Model for leaderboard entries"""
     __tablename__ = "leaderboard"
 
     id = Column(Integer, primary_key=True, index=True)
     player_name = Column(String, nullable=False, index=True)
-    scoring_system = Column(String, nullable=False, index=True)
+    # Lookups by system use ix_leaderboard_system_score below
+    scoring_system = Column(String, nullable=False)
     score = Column(Float, nullable=False)
     blend_count = Column(Integer, nullable=False)
     session_id = Column(String, nullable=False)
 
     # Timestamp
     achieved_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # Top-N per scoring system is an index scan instead of a sort
+        Index("ix_leaderboard_system_score", "scoring_system", "score"),
+    )
+
+
+# Player history pages are a range scan in (achieved_at, id) order
+Index(
+    "ix_leaderboard_player_history",
+    Leaderboard.player_name, Leaderboard.achieved_at.desc(), Leaderboard.id.desc()
+)
+
+
+class LeaderboardSummary(Base):
+    """
+    Per scoring system entry count, player count and score range, maintained
+    on submit so listing boards and counting entries don't scan the
+    leaderboard or player_bests tables
+    """
+    __tablename__ = "leaderboard_summaries"
+
+    scoring_system = Column(String, primary_key=True)
+    entry_count = Column(Integer, nullable=False, default=0)
+    player_count = Column(Integer, nullable=False, default=0)  # Rows in player_bests
+    max_score = Column(Float, nullable=False)
+    min_score = Column(Float, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class PlayerBest(Base):
+    """
+    Each player's best score per scoring system, kept up to date on submit
+    so the unique-players leaderboard is an indexed top-N instead of a
+    per-request DISTINCT ON over the whole leaderboard.
+    """
+    __tablename__ = "player_bests"
+
+    player_name = Column(String, primary_key=True)
+    scoring_system = Column(String, primary_key=True)
+    score = Column(Float, nullable=False)
+    blend_count = Column(Integer, nullable=False)
+    session_id = Column(String, nullable=False)
+    achieved_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_player_bests_system_score", "scoring_system", "score"),
+    )
+
+
+class PlayerName(Base):
+    """Distinct player names seen on the leaderboard, for player search"""
+    __tablename__ = "player_names"
+
+    id = Column(Integer, primary_key=True)
+    player_name = Column(String, nullable=False, unique=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+# PostgreSQL search indexes: a "C"-collated btree for case-insensitive
+# prefixes (LIKE range scan, read in index order), and a trigram GiST index
+# for typo-tolerant nearest-neighbour (<->) lookups. SQLite uses the
+# in-memory trie in player_search.py.
+Index(
+    "ix_player_names_lower_c",
+    func.lower(PlayerName.player_name).collate("C").label("name_lower")
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_player_names_lower_trgm_gist",
+    func.lower(PlayerName.player_name).label("name_lower"),
+    postgresql_using="gist",
+    postgresql_ops={"name_lower": "gist_trgm_ops"}
+).ddl_if(dialect="postgresql")
+event.listen(
+    Base.metadata, "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
+
+class LeaderboardWindowEntry(Base):
+    """
+    Leaderboard entries for the current daily/weekly windows.
+    Rows are added on submit and deleted by a background task once their
+    window has ended, so each board only ever holds one window's entries.
+    """
+    __tablename__ = "leaderboard_windows"
+
+    id = Column(Integer, primary_key=True, index=True)
+    window = Column(String, nullable=False)  # "daily" or "weekly"
+    window_start = Column(Date, nullable=False)  # UTC day, or the Monday starting the week
+    player_name = Column(String, nullable=False)
+    scoring_system = Column(String, nullable=False)
+    score = Column(Float, nullable=False)
+    blend_count = Column(Integer, nullable=False)
+    session_id = Column(String, nullable=False)
+    achieved_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_leaderboard_windows_board", "window", "scoring_system", "window_start", "score"),
+        Index("ix_leaderboard_windows_start", "window", "window_start"),
+    )
+
+
+class LeaderboardWindowCount(Base):
+    """Entry count of each daily/weekly board, rolled off with its entries"""
+    __tablename__ = "leaderboard_window_counts"
+
+    window = Column(String, primary_key=True)
+    window_start = Column(Date, primary_key=True)
+    scoring_system = Column(String, primary_key=True)
+    entry_count = Column(Integer, nullable=False, default=0)
+
+
+class CatalogVersion(Base):
+    """Record of each catalog data file applied to the database"""
+    __tablename__ = "catalog_versions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    checksum = Column(String, nullable=False, index=True)  # SHA-256 of the canonical catalog JSON
+    summary = Column(String)  # Row counts reported by the sync
+    applied_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class CatalogScores(Base):
+    """Object scores of each applied catalog, for verifying session tokens issued under it"""
+    __tablename__ = "catalog_scores"
+
+    checksum = Column(String, primary_key=True)  # Matches catalog_versions.checksum
+    object_scores = Column(JSON, nullable=False)  # {"<object id>": {scoring system: value}}
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class CacheVersion(Base):
+    """Version counter per cache scope, bumped by writers to invalidate worker caches"""
+    __tablename__ = "cache_versions"
+
+    scope = Column(String, primary_key=True)  # Currently only "catalog"
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
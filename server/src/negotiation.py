@@ -0,0 +1,146 @@
+"""
+MessagePack content negotiation
+
+Clients sending "Accept: application/msgpack" get JSON responses re-encoded
+as MessagePack, and request bodies sent as "Content-Type: application/msgpack"
+are decoded before the route sees them, so routes, response models and
+error handlers stay JSON-only. JSON remains the default: MessagePack is only
+chosen when the Accept header ranks it at least as high as application/json.
+
+Transcoding happens here rather than in a response class so that JSON
+clients keep FastAPI's dump_json fast path and pay nothing but a header
+lookup. MessagePack clients pay for that JSON encoding plus the transcode,
+about 3-4x the server CPU of a JSON response (see benchmarks/bench_msgpack.py). Bodies are decoded lazily, when the route reads them, so requests
+rejected before that (e.g. by admission control) are never decoded.
+"""
+import json
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import msgpack
+from fastapi import HTTPException
+
+MSGPACK = "application/msgpack"
+MSGPACK_TYPES = (MSGPACK, "application/x-msgpack", "application/vnd.msgpack")
+
+
+@lru_cache(maxsize=256)
+def wants_msgpack(accept: str) -> bool:
+    """True if an Accept header prefers MessagePack (ties go to the first listed)"""
+    weights: Dict[str, Tuple[float, int]] = {}
+    for position, item in enumerate(accept.split(",")):
+        media_type, *params = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights.setdefault(media_type.lower(), (quality, -position))
+
+    msgpack_weight = max((weights[t] for t in MSGPACK_TYPES if t in weights), default=(0.0, 0))
+    if msgpack_weight[0] <= 0:
+        return False
+    return msgpack_weight > weights.get("application/json", (0.0, 0))
+
+
+def _content_type(headers) -> bytes:
+    for name, value in headers:
+        if name == b"content-type":
+            return value.split(b";")[0].strip().lower()
+    return b""
+
+
+class MsgPackMiddleware:
+    """Pure ASGI middleware translating MessagePack requests and responses to and from JSON"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if _content_type(scope["headers"]).decode("latin-1") in MSGPACK_TYPES:
+            # Replace the headers in place: outer middlewares (metrics) read
+            # the route that the router stores in this same scope
+            scope["headers"] = [
+                (name, value) for name, value in scope["headers"]
+                if name not in (b"content-type", b"content-length")
+            ] + [(b"content-type", b"application/json")]
+            receive = self._decoding_receive(receive)
+
+        accept = dict(scope["headers"]).get(b"accept", b"").decode("latin-1")
+        if accept and wants_msgpack(accept):
+            send = self._encoding_send(send)
+        else:
+            send = self._vary_send(send)
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _decoding_receive(receive):
+        async def decoding_receive():
+            chunks = []
+            while True:
+                message = await receive()
+                if message["type"] != "http.request":
+                    return message
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    break
+            body = b"".join(chunks)
+            if body:
+                try:
+                    body = json.dumps(msgpack.unpackb(body), separators=(",", ":")).encode()
+                except (ValueError, TypeError, msgpack.UnpackException):
+                    raise HTTPException(status_code=400, detail="Invalid MessagePack body")
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        return decoding_receive
+
+    @staticmethod
+    def _vary_send(send):
+        # The response varies by Accept even when it is sent as JSON
+        async def vary_send(message):
+            is_start = message["type"] == "http.response.start"
+            if is_start and _content_type(message.get("headers", ())) == b"application/json":
+                message["headers"] = list(message["headers"]) + [(b"vary", b"Accept")]
+            await send(message)
+
+        return vary_send
+
+    @staticmethod
+    def _encoding_send(send):
+        start = None
+        chunks = []
+
+        async def encoding_send(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                if _content_type(message.get("headers", ())) == b"application/json":
+                    start = message
+                    return
+            elif message["type"] == "http.response.body" and start is not None:
+                chunks.append(message.get("body", b""))
+                if message.get("more_body", False):
+                    return
+                body = b"".join(chunks)
+                if body:
+                    body = msgpack.packb(json.loads(body))
+                headers = [
+                    (name, value) for name, value in start.get("headers", ())
+                    if name not in (b"content-type", b"content-length")
+                ]
+                headers += [
+                    (b"content-type", MSGPACK.encode()),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"vary", b"Accept")
+                ]
+                await send({**start, "headers": headers})
+                message = {"type": "http.response.body", "body": body, "more_body": False}
+            await send(message)
+
+        return encoding_send
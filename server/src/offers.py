@@ -0,0 +1,63 @@
+"""
+Deterministic "daily shop" offers (OFFER_MODE=daily_shop)
+
+Instead of a fresh random draw per request, the offers for a player are a
+pure function of their unlock tier (the highest unlock threshold they have
+reached, which determines the pool of available objects), the current time
+bucket (OFFER_BUCKET_SECONDS long, aligned to the epoch) and OFFER_SEED.
+All players of a tier see the same offers until the bucket ends, on every
+worker, so each list is drawn once per bucket and kept in memory, and the
+response can be cached by browsers and CDNs until the bucket ends.
+"""
+import random
+import time
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from catalog import CatalogSnapshot
+from config import settings
+from schemas import GameObjectResponse
+
+OFFER_MODES = ("random", "daily_shop")
+
+# (snapshot, bucket) the cached offers were drawn for, and (tier, count) -> offers
+_cache: Tuple[Optional[CatalogSnapshot], int, Dict] = (None, -1, {})
+_lock = Lock()
+
+
+def current_bucket(now: Optional[float] = None) -> Tuple[int, int]:
+    """Index of the current bucket and seconds until it ends"""
+    now = time.time() if now is None else now
+    bucket = int(now // settings.offer_bucket_seconds)
+    return bucket, max(1, int((bucket + 1) * settings.offer_bucket_seconds - now))
+
+
+def _draw(catalog: CatalogSnapshot, tier: int, bucket: int, count: int) -> Tuple[GameObjectResponse, ...]:
+    available = catalog.available(tier)
+    rng = random.Random(f"{settings.offer_seed}:{tier}:{bucket}:{count}")
+    return tuple(rng.sample(available, min(count, len(available))))
+
+
+def daily_offers(
+    catalog: CatalogSnapshot,
+    blend_count: int,
+    count: int,
+    bucket: int
+) -> Tuple[GameObjectResponse, ...]:
+    """The offers of `bucket` for players at `blend_count`"""
+    global _cache
+    tier = catalog.unlock_tier(blend_count)
+    if tier is None or count <= 0:
+        return ()
+    count = min(count, len(catalog.available(tier)))
+
+    with _lock:
+        snapshot, cached_bucket, offers = _cache
+        if snapshot is not catalog or cached_bucket != bucket:
+            # New bucket or reloaded catalog: start over
+            offers = {}
+            _cache = (catalog, bucket, offers)
+        key = (tier, count)
+        if key not in offers:
+            offers[key] = _draw(catalog, tier, bucket, count)
+        return offers[key]
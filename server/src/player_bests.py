@@ -0,0 +1,73 @@
+"""
+Best score per (player, scoring system) for the unique-players leaderboard
+
+record_best() inserts the player's first entry for a system, or otherwise
+overwrites the stored row only when the new score is higher (GREATEST
+semantics, but the blend count and session move with the score), and
+reports which it was so the summary's player count stays exact. rebuild() recomputes the
+table from the full leaderboard, for databases that had entries before
+the table existed.
+"""
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from database import insert_for
+from models import Leaderboard, PlayerBest
+
+
+def record_best(db: Session, entry: Leaderboard) -> bool:
+    """
+    Raise the player's best for the entry's scoring system if it beats it.
+    Returns True if this is the player's first entry for the system.
+    """
+    table = PlayerBest.__table__
+    stmt = insert_for(table, db.get_bind()).values(
+        player_name=entry.player_name,
+        scoring_system=entry.scoring_system,
+        score=entry.score,
+        blend_count=entry.blend_count,
+        session_id=entry.session_id
+    )
+    stmt = stmt.on_conflict_do_nothing(index_elements=[table.c.player_name, table.c.scoring_system])
+    if db.execute(stmt).rowcount:
+        return True
+
+    db.execute(
+        update(PlayerBest)
+        .where(
+            PlayerBest.player_name == entry.player_name,
+            PlayerBest.scoring_system == entry.scoring_system,
+            PlayerBest.score < entry.score
+        )
+        .values(
+            score=entry.score,
+            blend_count=entry.blend_count,
+            session_id=entry.session_id,
+            achieved_at=func.now()
+        )
+    )
+    return False
+
+
+def rebuild(db: Session) -> int:
+    """Recompute player_bests from the leaderboard. The caller commits."""
+    ranked = select(
+        Leaderboard.player_name,
+        Leaderboard.scoring_system,
+        Leaderboard.score,
+        Leaderboard.blend_count,
+        Leaderboard.session_id,
+        Leaderboard.achieved_at,
+        func.row_number().over(
+            partition_by=(Leaderboard.player_name, Leaderboard.scoring_system),
+            order_by=(Leaderboard.score.desc(), Leaderboard.achieved_at)
+        ).label("position")
+    ).subquery()
+    columns = ["player_name", "scoring_system", "score", "blend_count", "session_id", "achieved_at"]
+
+    db.execute(delete(PlayerBest))
+    result = db.execute(PlayerBest.__table__.insert().from_select(
+        columns,
+        select(*(ranked.c[name] for name in columns)).where(ranked.c.position == 1)
+    ))
+    return result.rowcount
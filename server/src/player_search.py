@@ -0,0 +1,358 @@
+"""
+Player name search: case-insensitive prefix matches, then typo-tolerant ones
+
+Submitting to the leaderboard records the player's name in player_names.
+On PostgreSQL, search() runs up to two LIMITed queries on lower(player_name),
+each reading only about `limit` index entries however many names match: a
+range scan of a "C"-collated btree for prefix matches, in index order, and
+if those don't fill the page, a nearest-neighbour (<->) scan of a pg_trgm
+GiST index for fuzzy matches.
+
+Other databases use an in-memory trie per worker (a sorted array, see
+PlayerTrie), loaded at startup and then incrementally from player_names
+(only rows added since the last load) in the background at most every
+PLAYER_SEARCH_REFRESH_INTERVAL seconds, so submits don't have to notify
+anyone. Fuzzy matching is skipped when the query matches a name exactly or
+the prefix matches fill the page. It looks up the query's one-edit variants
+first; only if none exist, queries of 8+ characters walk the trie for names
+two edits away, expanding at most FUZZY_MAX_NODES nodes.
+
+Matches are ranked exact, then prefix (alphabetically), then fuzzy (most
+similar first).
+"""
+from bisect import bisect_left, bisect_right
+from heapq import heappop, heappush
+from threading import Lock, Thread
+from time import monotonic
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Float, func, select, true
+from sqlalchemy.orm import Session
+
+from config import settings
+from database import SessionLocal, insert_for
+from models import Leaderboard, PlayerName
+
+
+def record_player(db: Session, player_name: str) -> None:
+    """Add a player name to the search index table if it's new. The caller commits."""
+    stmt = insert_for(PlayerName.__table__, db.get_bind()).values(player_name=player_name)
+    db.execute(stmt.on_conflict_do_nothing(index_elements=[PlayerName.__table__.c.player_name]))
+
+
+def _max_distance(query: str) -> int:
+    """Edit distance tolerated for a query, so short queries don't match everything"""
+    if len(query) < 3:
+        return 0
+    return 1 if len(query) < 8 else 2
+
+
+# Trie nodes a fuzzy lookup may expand; bounds its cost on large name sets
+FUZZY_MAX_NODES = 500
+# Refreshes adding more names than this re-sort instead of inserting one by one
+INSERT_LIMIT = 1000
+
+
+def _after(prefix: str) -> str:
+    """Smallest string greater than every string starting with `prefix`"""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class PlayerTrie:
+    """
+    Lower-cased prefix trie of player names with bounded edit-distance lookup.
+    The trie is implicit: names are kept as two parallel lists sorted by
+    their lower-cased form, and a trie node (a prefix) is the slice of names
+    starting with it, found by bisection. At a million names this takes a
+    fraction of the memory and build time of a node per character, and
+    prefix lookups are two bisections and a slice.
+    """
+
+    def __init__(self):
+        self.keys: List[str] = []  # Lower-cased names, sorted
+        self.names: List[str] = []  # Original spellings, in the same order
+        self.alphabet = ""  # Every character used in the keys
+
+    @property
+    def size(self) -> int:
+        return len(self.names)
+
+    def add_all(self, names: List[str]) -> "PlayerTrie":
+        """
+        A new trie with the (new) `names` added; tries are never modified, so
+        searches need no lock
+        """
+        trie = PlayerTrie()
+        trie.alphabet = "".join(sorted(set(self.alphabet).union(*(name.lower() for name in names))))
+        if len(names) > INSERT_LIMIT:
+            pairs = sorted([*zip(self.keys, self.names), *((name.lower(), name) for name in names)])
+            trie.keys = [key for key, _ in pairs]
+            trie.names = [name for _, name in pairs]
+            return trie
+        # A few names: splice them in between slices of the current lists
+        previous = 0
+        for key, name in sorted((name.lower(), name) for name in names):
+            position = bisect_right(self.keys, key, previous)
+            trie.keys += self.keys[previous:position]
+            trie.names += self.names[previous:position]
+            trie.keys.append(key)
+            trie.names.append(name)
+            previous = position
+        trie.keys += self.keys[previous:]
+        trie.names += self.names[previous:]
+        return trie
+
+    def prefix(self, key: str, limit: int) -> List[str]:
+        """Names starting with `key`, in alphabetical order of their lower-cased form"""
+        start = bisect_left(self.keys, key)
+        end = min(start + limit, bisect_left(self.keys, _after(key), start))
+        return self.names[start:end]
+
+    def _lookup(self, key: str) -> List[str]:
+        index = bisect_left(self.keys, key)
+        found = []
+        while index < len(self.keys) and self.keys[index] == key:
+            found.append(self.names[index])
+            index += 1
+        return found
+
+    def one_edit(self, key: str) -> List[Tuple[int, str]]:
+        """
+        (1, name) for names one edit (insertion, deletion, substitution or swap
+        of adjacent letters) away from `key`, keeping the first letter. Looks up
+        every such variant of `key`, about 2 * len(key) * len(alphabet) of them,
+        which is much cheaper than walking the trie for the same answer.
+        """
+        first, rest = key[:1], key[1:]
+        variants = set()
+        for i in range(len(rest) + 1):
+            head, tail = rest[:i], rest[i:]
+            if tail:
+                variants.add(head + tail[1:])
+            if len(tail) > 1:
+                variants.add(head + tail[1] + tail[0] + tail[2:])
+            for char in self.alphabet:
+                variants.add(head + char + tail)
+                if tail:
+                    variants.add(head + char + tail[1:])
+        variants.discard(rest)
+        return [(1, name) for variant in variants for name in self._lookup(first + variant)]
+
+    def _children(self, prefix: str, lo: int, hi: int) -> List[Tuple[str, int, int]]:
+        """(next letter, start, end) of the child nodes of `prefix` within keys[lo:hi]"""
+        children = []
+        depth = len(prefix)
+        while lo < hi:
+            next_char = self.keys[lo][depth]
+            end = bisect_left(self.keys, _after(prefix + next_char), lo, hi)
+            children.append((next_char, lo, end))
+            lo = end
+        return children
+
+    def fuzzy(self, key: str, max_distance: int, max_nodes: int = FUZZY_MAX_NODES) -> List[Tuple[int, str]]:
+        """
+        (edit distance, name) for names within `max_distance` edits of `key`,
+        counting a swap of adjacent letters as one edit. The first letter
+        must match, which keeps the walk to one subtree of the root. Nodes are
+        expanded best first (lowest distance row first) and the walk stops
+        after `max_nodes`, so the closest matches are found within the budget.
+        """
+        keys, found = self.keys, []
+        first, rest = key[:1], key[1:]
+        lo = bisect_left(keys, first)
+        hi = bisect_left(keys, _after(first), lo)
+        # Each heap entry is a node with its distance row (and its parent's,
+        # for swaps); a branch is pruned once every cell exceeds max_distance
+        heap = [(0, first, lo, hi, list(range(len(rest) + 1)), None)]
+        expanded = 0
+        while heap and expanded < max_nodes:
+            lowest, prefix, lo, hi, row, parent_row = heappop(heap)
+            expanded += 1
+            depth = len(prefix)
+            char = prefix[-1]
+            i = lo
+            while i < hi and len(keys[i]) == depth:
+                if row[-1] <= max_distance:
+                    found.append((row[-1], self.names[i]))
+                i += 1
+            if i == hi:
+                continue
+            if lowest < max_distance:
+                children = self._children(prefix, i, hi)
+            else:
+                # Out of edits: only a matching letter (or the second half of a
+                # swap) keeps some cell within max_distance, so skip the rest
+                wanted = {rest[k - 1] for k in range(1, len(rest) + 1) if row[k - 1] <= max_distance}
+                if parent_row is not None:
+                    wanted.update(
+                        rest[k - 2] for k in range(2, len(rest) + 1)
+                        if rest[k - 1] == char and parent_row[k - 2] < max_distance
+                    )
+                children = []
+                for next_char in sorted(wanted):
+                    child = prefix + next_char
+                    start = bisect_left(keys, child, i, hi)
+                    end = bisect_left(keys, _after(child), start, hi)
+                    if start < end:
+                        children.append((next_char, start, end))
+            for next_char, start, end in children:
+                child_row = [row[0] + 1]
+                for k in range(1, len(rest) + 1):
+                    cost = min(
+                        child_row[k - 1] + 1,
+                        row[k] + 1,
+                        row[k - 1] + (rest[k - 1] != next_char)
+                    )
+                    if parent_row is not None and k > 1 and rest[k - 1] == char and rest[k - 2] == next_char:
+                        cost = min(cost, parent_row[k - 2] + 1)
+                    child_row.append(cost)
+                child_lowest = min(child_row)
+                if child_lowest <= max_distance:
+                    heappush(heap, (child_lowest, prefix + next_char, start, end, child_row,
+                                    row if depth > 1 else None))
+        return found
+
+
+class TrieIndex:
+    """
+    Per-worker trie over player_names. The first search loads it (startup
+    warms it first); later refreshes load only rows added since, in a
+    background thread, and swap in a new trie, so searches never wait on them.
+    """
+
+    def __init__(self):
+        self.trie = PlayerTrie()
+        self.last_id = 0
+        self.refreshed_at: Optional[float] = None
+        self._lock = Lock()
+        self._refreshing = Lock()
+
+    @property
+    def stale(self) -> bool:
+        return (
+            self.refreshed_at is None
+            or monotonic() - self.refreshed_at >= settings.player_search_refresh_interval
+        )
+
+    def refresh(self, db: Session) -> None:
+        """Load player names added since the last refresh"""
+        with self._lock:
+            rows = db.execute(
+                select(PlayerName.id, PlayerName.player_name)
+                .where(PlayerName.id > self.last_id)
+                .order_by(PlayerName.id)
+            ).all()
+            if rows:
+                self.trie = self.trie.add_all([name for _, name in rows])
+                self.last_id = rows[-1][0]
+            self.refreshed_at = monotonic()
+
+    def _refresh_in_background(self) -> None:
+        # One refresh at a time, off the request path
+        if not self._refreshing.acquire(blocking=False):
+            return
+
+        def run():
+            try:
+                with SessionLocal() as db:
+                    self.refresh(db)
+            finally:
+                self._refreshing.release()
+
+        Thread(target=run, name="player-trie-refresh", daemon=True).start()
+
+    def search(self, db: Session, query: str, limit: int) -> List[Tuple[str, str]]:
+        if self.refreshed_at is None:
+            self.refresh(db)
+        elif self.stale:
+            self._refresh_in_background()
+        return _search_trie(self.trie, query, limit)
+
+
+def _search_trie(trie: PlayerTrie, query: str, limit: int) -> List[Tuple[str, str]]:
+    key = query.lower()
+    results = [
+        (name, "exact" if name.lower() == key else "prefix")
+        for name in trie.prefix(key, limit)
+    ]
+    # Exact matches first; prefix matches are in alphabetical order
+    results.sort(key=lambda result: result[1] != "exact")
+    if len(results) >= limit or not _max_distance(key) or (results and results[0][1] == "exact"):
+        return results
+
+    # Names one edit away are enough; only look further (by walking the trie,
+    # for long queries) if there are none
+    matches = trie.one_edit(key)
+    if not matches and _max_distance(key) > 1:
+        matches = trie.fuzzy(key, _max_distance(key))
+    seen = {name for name, _ in results}
+    for _, name in sorted(matches):
+        if name not in seen:
+            results.append((name, "fuzzy"))
+            seen.add(name)
+        if len(results) >= limit:
+            break
+    return results
+
+
+trie_index = TrieIndex()
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _search_postgres(db: Session, query: str, limit: int) -> List[Tuple[str, str]]:
+    key = query.lower()
+    name_lower = func.lower(PlayerName.player_name)
+    # Same expression and collation as ix_player_names_lower_c
+    name_c = name_lower.collate("C")
+    prefix_names = db.execute(
+        select(PlayerName.player_name)
+        .where(name_c.like(_escape_like(key) + "%", escape="\\"))
+        .order_by(name_c)
+        .limit(limit)
+    ).scalars().all()
+    results = [(name, "exact" if name.lower() == key else "prefix") for name in prefix_names]
+
+    if len(results) < limit and _max_distance(key):
+        # Nearest neighbours by trigram distance, within pg_trgm.similarity_threshold
+        # (the % operator, 0.3 by default); over-fetch to skip the prefix matches
+        seen = set(prefix_names)
+        fuzzy_names = db.execute(
+            select(PlayerName.player_name)
+            .where(name_lower.op("%")(key))
+            .order_by(name_lower.op("<->", return_type=Float)(key))
+            .limit(limit + len(seen))
+        ).scalars().all()
+        results.extend((name, "fuzzy") for name in fuzzy_names if name not in seen)
+
+    # Exact matches first; prefix matches are already in alphabetical order
+    results.sort(key=lambda result: result[1] != "exact")
+    return results[:limit]
+
+
+def uses_trie(db: Session) -> bool:
+    return settings.player_search_backend == "trie" or (
+        settings.player_search_backend == "auto" and db.get_bind().dialect.name != "postgresql"
+    )
+
+
+def search(db: Session, query: str, limit: int = 20) -> List[Tuple[str, str]]:
+    """
+    Ranked (player_name, match) pairs where match is exact, prefix or fuzzy.
+    Blocking: async routes run it in the threadpool.
+    """
+    if uses_trie(db):
+        return trie_index.search(db, query, limit)
+    return _search_postgres(db, query, limit)
+
+
+def rebuild(db: Session) -> int:
+    """Add every leaderboard player missing from player_names. The caller commits."""
+    stmt = insert_for(PlayerName.__table__, db.get_bind()).from_select(
+        ["player_name"],
+        # WHERE true: SQLite can't otherwise tell ON CONFLICT from a join constraint
+        select(Leaderboard.player_name).distinct().where(true())
+    ).on_conflict_do_nothing(index_elements=[PlayerName.__table__.c.player_name])
+    return db.execute(stmt).rowcount
@@ -0,0 +1,206 @@
+"""
+On-demand profiling of single requests
+
+Only installed when PROFILING_TOKEN is set, so there is no overhead at all
+otherwise. A request carrying "X-Profile: <token>" is profiled and the
+profile stored in PROFILE_DIR; the response's X-Profile-Id header names it,
+and GET /debug/profiles/{id} (with the same X-Profile header) downloads it.
+The token is only accepted in the header, never in the URL, so it does not
+end up in access logs, proxy logs or browser history.
+
+X-Profile-Mode selects the profiler:
+- cprofile (default): deterministic cProfile of the event loop thread,
+  saved as a .pstats file (python -m pstats, snakeviz)
+- sample: a stack sampler reading the event loop thread's frames every
+  PROFILE_SAMPLE_INTERVAL seconds, saved as speedscope JSON
+  (https://www.speedscope.app)
+
+Both observe the event loop thread, where the route handlers run, so
+concurrent requests interleaving with the profiled one show up too, and
+work handed to the threadpool does not. Profile in a quiet environment;
+while one request is being profiled, others are served unprofiled.
+"""
+import cProfile
+import hmac
+import json
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import FileResponse
+
+from config import settings
+
+PROFILE_HEADER = b"x-profile"
+MODE_HEADER = b"x-profile-mode"
+_PROFILE_ID = re.compile(r"^[\w.-]+\.(pstats|speedscope\.json)$")
+
+# Only one profiler can observe the event loop thread at a time
+_profiling = threading.Lock()
+
+
+def _authorized(token: Optional[str]) -> bool:
+    return bool(token) and hmac.compare_digest(token.encode(), settings.profiling_token.encode())
+
+
+class StackSampler:
+    """Samples one thread's Python stack from a background thread"""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.frames: Dict[Tuple[str, str, int], int] = {}
+        self.samples: List[List[int]] = []
+        self.weights: List[float] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self._started
+
+    def _frame_index(self, code) -> int:
+        key = (code.co_name, code.co_filename, code.co_firstlineno)
+        index = self.frames.get(key)
+        if index is None:
+            index = self.frames[key] = len(self.frames)
+        return index
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._frame_index(frame.f_code))
+                frame = frame.f_back
+            stack.reverse()
+            self.samples.append(stack)
+            self.weights.append(now - last)
+            last = now
+
+    def speedscope(self, name: str) -> dict:
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "exporter": "chaos-blender",
+            "name": name,
+            "shared": {
+                "frames": [
+                    {"name": code_name, "file": filename, "line": line}
+                    for code_name, filename, line in self.frames
+                ]
+            },
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": self.duration,
+                "samples": self.samples,
+                "weights": self.weights
+            }]
+        }
+
+
+def _prune(directory: str, keep: int) -> None:
+    profiles = sorted(
+        (entry for entry in os.scandir(directory) if _PROFILE_ID.match(entry.name)),
+        key=lambda entry: entry.stat().st_mtime
+    )
+    for entry in profiles[:-keep] if keep > 0 else profiles:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+class ProfilingMiddleware:
+    """Pure ASGI middleware profiling requests that carry the profiling token"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        token = headers.get(PROFILE_HEADER, b"").decode("latin-1")
+        if not _authorized(token) or not _profiling.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self._profile(scope, receive, send, headers)
+        finally:
+            _profiling.release()
+
+    async def _profile(self, scope, receive, send, headers) -> None:
+        mode = headers.get(MODE_HEADER, b"cprofile").decode("latin-1")
+        if mode not in ("cprofile", "sample"):
+            mode = "cprofile"
+        slug = re.sub(r"[^\w]+", "_", scope["path"]).strip("_") or "root"
+        extension = "pstats" if mode == "cprofile" else "speedscope.json"
+        profile_id = f"{int(time.time())}-{scope['method']}-{slug}-{uuid.uuid4().hex[:8]}.{extension}"
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        if mode == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                profiler.disable()
+                self._save(profile_id, lambda path: profiler.dump_stats(path))
+        else:
+            sampler = StackSampler(threading.get_ident(), settings.profile_sample_interval)
+            sampler.start()
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                sampler.stop()
+                name = f"{scope['method']} {scope['path']}"
+                self._save(profile_id, lambda path: _write_json(path, sampler.speedscope(name)))
+
+    @staticmethod
+    def _save(profile_id: str, write) -> None:
+        os.makedirs(settings.profile_dir, exist_ok=True)
+        write(os.path.join(settings.profile_dir, profile_id))
+        _prune(settings.profile_dir, settings.profile_keep)
+
+
+def _write_json(path: str, data: dict) -> None:
+    with open(path, "w") as f:
+        json.dump(data, f, separators=(",", ":"))
+
+
+router = APIRouter()
+
+
+@router.get("/debug/profiles/{profile_id}")
+async def get_profile(profile_id: str, x_profile: Optional[str] = Header(default=None)):
+    """Download a stored profile (requires the profiling token in X-Profile)"""
+    if not _authorized(x_profile):
+        raise HTTPException(status_code=403, detail="Profiling token required")
+    path = os.path.join(settings.profile_dir, profile_id)
+    if not _PROFILE_ID.match(profile_id) or not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, filename=profile_id)
@@ -0,0 +1,95 @@
+"""
+Field selection (?fields=id,name,...) for game object responses
+
+parse_fields() validates the requested names against GameObjectResponse.
+For each distinct field set a projected model and its serializers are
+built once and cached, so a projected response costs about the same as a
+full one, minus the fields left out. Projected responses are returned as
+ready-made JSON Responses, which bypass the route's (full) response_model.
+"""
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple, Type
+
+from fastapi import HTTPException, Query
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+
+from schemas import GameObjectResponse, SessionResponse
+
+FieldSet = Tuple[str, ...]
+
+OBJECT_FIELDS = tuple(GameObjectResponse.model_fields)
+
+FIELDS_QUERY = Query(
+    default=None,
+    description=f"Comma-separated game object fields to return ({', '.join(OBJECT_FIELDS)})"
+)
+
+
+def parse_fields(fields: Optional[str]) -> Optional[FieldSet]:
+    """Normalize a fields parameter; None means the full response"""
+    if not fields:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested.difference(OBJECT_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    if not requested:
+        return None
+    # Canonical order, so "name,id" and "id,name" share a cache entry
+    return tuple(name for name in OBJECT_FIELDS if name in requested)
+
+
+@lru_cache(maxsize=128)
+def object_model(fields: FieldSet) -> Type[BaseModel]:
+    """GameObjectResponse restricted to `fields`"""
+    return create_model(
+        f"GameObjectResponse[{','.join(fields)}]",
+        __config__=ConfigDict(from_attributes=True),
+        **{
+            name: (GameObjectResponse.model_fields[name].annotation, ...)
+            for name in fields
+        }
+    )
+
+
+@lru_cache(maxsize=128)
+def _objects_adapter(fields: FieldSet) -> TypeAdapter:
+    return TypeAdapter(List[object_model(fields)])
+
+
+@lru_cache(maxsize=128)
+def _session_model(fields: FieldSet) -> Type[BaseModel]:
+    return create_model(
+        f"SessionResponse[{','.join(fields)}]",
+        __base__=SessionResponse,
+        available_objects=(List[object_model(fields)], ...)
+    )
+
+
+def _json(content: bytes) -> Response:
+    return Response(content=content, media_type="application/json")
+
+
+def project_object(obj, fields: FieldSet) -> Response:
+    """A single object (a catalog entry or a GameObject row) with only `fields`"""
+    return _json(object_model(fields).model_validate(obj).model_dump_json())
+
+
+def project_objects(objects: Iterable, fields: FieldSet) -> Response:
+    """A list of objects with only `fields`"""
+    adapter = _objects_adapter(fields)
+    return _json(adapter.dump_json(adapter.validate_python(list(objects), from_attributes=True)))
+
+
+def project_session(session: SessionResponse, fields: FieldSet) -> Response:
+    """A session response whose available objects carry only `fields`"""
+    model = _session_model(fields)
+    data = dict(session)
+    data["available_objects"] = _objects_adapter(fields).validate_python(
+        data["available_objects"], from_attributes=True
+    )
+    return _json(model.model_construct(**data).model_dump_json())
@@ -0,0 +1,77 @@
+"""
+Read replica lag monitoring
+
+Measures how far DATABASE_READ_URL lags behind the primary: as a
+maintenance job, and in the background whenever a read finds the last
+measurement older than REPLICA_CHECK_INTERVAL (so the check also runs with
+BACKGROUND_JOBS=false). While the lag exceeds MAX_REPLICA_LAG seconds, is
+unknown, or the replica can't be reached, read_session() sends every read
+to the primary, so replica reads are never staler than that bound.
+"""
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from database import ReadSessionLocal, engine, read_engine, replica_routing
+from metrics import Gauge, registry
+
+logger = logging.getLogger(__name__)
+
+registry.register(Gauge(
+    "chaos_blender_replica_lag_seconds",
+    "Measured replication lag of the read replica (-1 when unknown or unreachable)",
+    callback=lambda: {(): replica_routing.lag} if replica_enabled() else {}
+))
+
+# Age of the last replayed transaction. Unlike comparing the received and
+# replayed WAL positions, this grows while the WAL receiver is stalled. It
+# also grows while the primary is idle, which only sends reads to the
+# primary. NULL (unknown) until the replica has replayed a transaction.
+_LAG_SQL = text("""
+    SELECT CASE
+        WHEN pg_is_in_recovery() THEN EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+        ELSE 0
+    END
+""")
+
+
+def replica_enabled() -> bool:
+    return read_engine is not engine
+
+
+def measure_replica_lag() -> Optional[float]:
+    """
+    Replication lag of the read replica in seconds (0 for databases without
+    replication, None if unknown)
+    """
+    db = ReadSessionLocal()
+    try:
+        if read_engine.dialect.name != "postgresql":
+            db.execute(text("SELECT 1"))
+            return 0.0
+        lag = db.execute(_LAG_SQL).scalar()
+        return None if lag is None else max(0.0, float(lag))
+    finally:
+        db.close()
+
+
+def check_replica(db: Session = None) -> str:
+    """Maintenance job: update whether reads may use the replica"""
+    was_usable = replica_routing.usable
+    try:
+        lag = measure_replica_lag()
+    except Exception as e:
+        replica_routing.record_check(None)
+        logger.warning("Read replica unreachable, reading from the primary: %s", e)
+        return ""
+
+    replica_routing.record_check(lag)
+    if replica_routing.usable != was_usable:
+        measured = "unknown" if lag is None else f"{lag:.1f}s"
+        return f"replica lag {measured}, {'using' if replica_routing.usable else 'bypassing'} the replica"
+    return ""
+
+
+replica_routing.checker = check_replica
@@ -1,32 +1,75 @@
 """
 API routes for leaderboards
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, select, tuple_
 from typing import List, Optional
 
-from database import get_db
-from models import Leaderboard, PlayerScore, ScoringSystem
-from schemas import LeaderboardEntry, LeaderboardResponse
+from admission import admit_session
+from catalog import catalog_scores
+from config import settings
+from database import LAST_WRITE_HEADER, get_db, get_read_db, read_session, write_marker
+from leaderboard_summary import record_summary
+from leaderboard_windows import board_count, record_entry, window_start
+from models import Leaderboard, LeaderboardSummary, LeaderboardWindowEntry, PlayerBest, PlayerScore, ScoringSystem
+from player_bests import record_best
+from player_search import record_player, search
+from schemas import LeaderboardEntry, LeaderboardResponse, LeaderboardSummaryResponse, PlayerHistoryResponse, PlayerSearchResult
+from singleflight import SingleFlight
+from tokens import TokenError, verify, verify_against_catalog
 
 router = APIRouter()
 
+leaderboard_flight = SingleFlight("leaderboard", read_session)
+player_history_flight = SingleFlight("player_history", read_session)
+
+
+@router.get("/summaries", response_model=List[LeaderboardSummaryResponse])
+async def get_leaderboard_summaries(db: Session = Depends(get_read_db)):
+    """Entry count, score range and last update for every leaderboard"""
+    return db.query(LeaderboardSummary).order_by(LeaderboardSummary.scoring_system).all()
+
 
 @router.get("/{scoring_system}", response_model=LeaderboardResponse)
 async def get_leaderboard(
     scoring_system: str,
     limit: int = Query(default=100, le=500),
-    db: Session = Depends(get_db)
+    window: str = Query(default="all", pattern="^(all|daily|weekly)$"),
+    unique_players: bool = False
 ):
     """
     Get leaderboard for a specific scoring system
-    Returns top scores for the given scoring system
+    Returns top scores for the given scoring system, either all-time or
+    for the current UTC day ("daily") or week starting Monday ("weekly").
+    With unique_players each player appears once, with their best score.
+    Identical concurrent requests share one query.
     """
+    if unique_players and window != "all":
+        raise HTTPException(status_code=400, detail="unique_players is only available for the all-time leaderboard")
+    return await leaderboard_flight.query(_load_leaderboard, scoring_system, limit, window, unique_players)
+
+
+def _load_leaderboard(
+    db: Session, scoring_system: str, limit: int, window: str, unique_players: bool
+) -> LeaderboardResponse:
+    if unique_players:
+        model = PlayerBest
+        board = db.query(PlayerBest).filter(PlayerBest.scoring_system == scoring_system)
+    elif window == "all":
+        model = Leaderboard
+        board = db.query(Leaderboard).filter(Leaderboard.scoring_system == scoring_system)
+    else:
+        model = LeaderboardWindowEntry
+        board = db.query(LeaderboardWindowEntry).filter(
+            LeaderboardWindowEntry.window == window,
+            LeaderboardWindowEntry.scoring_system == scoring_system,
+            LeaderboardWindowEntry.window_start == window_start(window)
+        )
+
     # Query leaderboard entries
-    entries = db.query(Leaderboard).filter(
-        Leaderboard.scoring_system == scoring_system
-    ).order_by(desc(Leaderboard.score)).limit(limit).all()
+    entries = board.order_by(desc(model.score)).limit(limit).all()
 
     # Add rank to each entry
     leaderboard_entries = []
@@ -42,38 +85,66 @@ async def get_leaderboard(
             )
         )
 
-    total = db.query(Leaderboard).filter(
-        Leaderboard.scoring_system == scoring_system
-    ).count()
+    # Totals come from counters maintained on submit, not from counting the board
+    if model is LeaderboardWindowEntry:
+        total = board_count(db, window, scoring_system)
+    else:
+        count_column = LeaderboardSummary.player_count if unique_players else LeaderboardSummary.entry_count
+        total = db.query(count_column).filter(
+            LeaderboardSummary.scoring_system == scoring_system
+        ).scalar() or 0
 
     return LeaderboardResponse(
         scoring_system=scoring_system,
+        window=window,
+        unique_players=unique_players,
         entries=leaderboard_entries,
         total_entries=total
     )
 
 
 @router.get("/", response_model=List[str])
-async def get_available_leaderboards(db: Session = Depends(get_db)):
+async def get_available_leaderboards(db: Session = Depends(get_read_db)):
     """Get list of all scoring systems with leaderboard entries"""
-    systems = db.query(Leaderboard.scoring_system).distinct().all()
+    systems = db.query(LeaderboardSummary.scoring_system).filter(
+        LeaderboardSummary.entry_count > 0
+    ).all()
     return [system[0] for system in systems]
 
 
 @router.post("/submit/{session_id}")
 async def submit_to_leaderboard(
     session_id: str,
+    response: Response,
     player_name: str = Query(..., min_length=1, max_length=50),
+    session_token: Optional[str] = Header(default=None, alias="X-Session-Token"),
     db: Session = Depends(get_db)
 ):
     """
     Submit current session scores to the global leaderboard
+    Token based sessions (SESSION_TOKENS) pass their token in X-Session-Token;
+    its scores are checked against the catalog and the session is stored now
     """
+    admit_session(session_id)
     # Get player session
     player_score = db.query(PlayerScore).filter(
         PlayerScore.session_id == session_id
     ).first()
 
+    if session_token and settings.session_tokens:
+        try:
+            state = verify(session_token, session_id)
+        except TokenError as e:
+            raise HTTPException(status_code=401, detail=str(e))
+        if not verify_against_catalog(state, lambda checksum: catalog_scores(db, checksum)):
+            raise HTTPException(status_code=400, detail="Session scores do not match the game catalog")
+        if not player_score:
+            player_score = PlayerScore(player_name=player_name, session_id=session_id)
+            db.add(player_score)
+        player_score.blend_count = state.blend_count
+        player_score.scores = state.scores
+        player_score.blended_objects = state.blended_objects()
+
     if not player_score:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -82,10 +153,12 @@ async def submit_to_leaderboard(
 
     # Update player name
     player_score.player_name = player_name
+    record_player(db, player_name)
 
-    # Create leaderboard entries for each scoring system
+    # Create leaderboard entries for each scoring system, in sorted order so
+    # concurrent submits lock the shared per-system rows in the same order
     submitted_systems = []
-    for scoring_system, score in player_score.scores.items():
+    for scoring_system, score in sorted(player_score.scores.items()):
         # Check if entry already exists for this session
         existing = db.query(Leaderboard).filter(
             Leaderboard.session_id == session_id,
@@ -101,9 +174,13 @@ async def submit_to_leaderboard(
                 session_id=session_id
             )
             db.add(leaderboard_entry)
+            record_entry(db, leaderboard_entry)
+            new_player = record_best(db, leaderboard_entry)
+            record_summary(db, leaderboard_entry, new_player)
             submitted_systems.append(scoring_system)
 
     db.commit()
+    response.headers[LAST_WRITE_HEADER] = write_marker()
 
     return {
         "message": "Scores submitted successfully",
@@ -113,26 +190,70 @@ async def submit_to_leaderboard(
     }
 
 
-@router.get("/player/{player_name}", response_model=List[LeaderboardEntry])
+@router.get("/players/search", response_model=List[PlayerSearchResult])
+async def search_players(
+    q: str = Query(..., min_length=1, max_length=50),
+    limit: int = Query(default=20, ge=1, le=100),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Search player names, case-insensitively
+    Exact matches come first, then names starting with q, then near misses
+    """
+    results = await run_in_threadpool(search, db, q, limit)
+    return [PlayerSearchResult(player_name=name, match=match) for name, match in results]
+
+
+@router.get("/player/{player_name}", response_model=PlayerHistoryResponse)
 async def get_player_scores(
     player_name: str,
-    db: Session = Depends(get_db)
+    scoring_system: Optional[str] = None,
+    cursor: Optional[int] = None,
+    limit: int = Query(default=50, ge=1, le=200)
 ):
-    """Get all leaderboard entries for a specific player"""
-    entries = db.query(Leaderboard).filter(
-        Leaderboard.player_name == player_name
-    ).order_by(desc(Leaderboard.achieved_at)).all()
+    """
+    Get leaderboard entries for a specific player, newest first
+    Pass the returned next_cursor to fetch the following page
+    """
+    return await player_history_flight.query(_load_player_history, player_name, scoring_system, cursor, limit)
 
-    if not entries:
-        raise HTTPException(status_code=404, detail="Player not found on leaderboard")
 
-    return [
-        LeaderboardEntry(
-            player_name=entry.player_name,
-            scoring_system=entry.scoring_system,
-            score=entry.score,
-            blend_count=entry.blend_count,
-            achieved_at=entry.achieved_at
+def _load_player_history(
+    db: Session, player_name: str, scoring_system: Optional[str], cursor: Optional[int], limit: int
+) -> PlayerHistoryResponse:
+    query = db.query(Leaderboard).filter(Leaderboard.player_name == player_name)
+    if scoring_system:
+        query = query.filter(Leaderboard.scoring_system == scoring_system)
+    if cursor is not None:
+        # Keyset pagination: continue after the cursor entry in (achieved_at, id) order
+        cursor_achieved_at = select(Leaderboard.achieved_at).where(
+            Leaderboard.id == cursor
+        ).scalar_subquery()
+        query = query.filter(
+            tuple_(Leaderboard.achieved_at, Leaderboard.id) < tuple_(cursor_achieved_at, cursor)
         )
-        for entry in entries
-    ]
+
+    entries = query.order_by(
+        desc(Leaderboard.achieved_at), desc(Leaderboard.id)
+    ).limit(limit + 1).all()
+
+    if not entries and cursor is None:
+        raise HTTPException(status_code=404, detail="Player not found on leaderboard")
+
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    return PlayerHistoryResponse(
+        player_name=player_name,
+        entries=[
+            LeaderboardEntry(
+                player_name=entry.player_name,
+                scoring_system=entry.scoring_system,
+                score=entry.score,
+                blend_count=entry.blend_count,
+                achieved_at=entry.achieved_at
+            )
+            for entry in entries
+        ],
+        next_cursor=entries[-1].id if has_more else None
+    )
@@ -1,68 +1,150 @@
 """
 API routes for game objects
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-
-from database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session, load_only
+from typing import List, Optional
+import json
+import os
+import random
+
+from catalog import get_catalog
+from config import settings
+from database import get_read_db
 from models import GameObject
-from schemas import GameObjectResponse
+from offers import OFFER_MODES, current_bucket, daily_offers
+from projection import FIELDS_QUERY, parse_fields, project_object, project_objects
+from schemas import GameObjectResponse, SpriteManifestResponse
 
 router = APIRouter()
 
+# (mtime, response) of the last sprite manifest read
+_sprite_manifest = (None, None)
+
 
 @router.get("/available/{blend_count}", response_model=List[GameObjectResponse])
-async def get_available_objects(blend_count: int, db: Session = Depends(get_db)):
+async def get_available_objects(
+    blend_count: int,
+    fields: Optional[str] = FIELDS_QUERY,
+    db: Session = Depends(get_read_db)
+):
     """
     Get objects available based on current blend count
     Returns objects where unlock_threshold <= blend_count
     """
-    objects = db.query(GameObject).filter(
-        GameObject.unlock_threshold <= blend_count
-    ).all()
+    field_set = parse_fields(fields)
+    objects = get_catalog(db).available(blend_count)
 
     if not objects:
         raise HTTPException(status_code=404, detail="No objects available")
 
+    if field_set:
+        return project_objects(objects, field_set)
     return objects
 
 
 @router.get("/random/{blend_count}/{count}", response_model=List[GameObjectResponse])
 async def get_random_objects(
     blend_count: int,
+    response: Response,
     count: int = 3,
-    db: Session = Depends(get_db)
+    mode: Optional[str] = Query(default=None, description="random or daily_shop (default: OFFER_MODE)"),
+    fields: Optional[str] = FIELDS_QUERY,
+    db: Session = Depends(get_read_db)
 ):
     """
     Get random objects available for selection
-    Returns 'count' random objects from available pool
+    Returns 'count' random objects from available pool. In daily_shop mode
+    they are the same for every player of the unlock tier until the current
+    bucket ends, and the response may be cached until then.
     """
-    from sqlalchemy.sql.expression import func
-
-    objects = db.query(GameObject).filter(
-        GameObject.unlock_threshold <= blend_count
-    ).order_by(func.random()).limit(count).all()
+    field_set = parse_fields(fields)
+    mode = mode or settings.offer_mode
+    if mode not in OFFER_MODES:
+        raise HTTPException(status_code=400, detail=f"mode must be one of: {', '.join(OFFER_MODES)}")
+
+    catalog = get_catalog(db)
+    cache_control = None
+    if mode == "daily_shop":
+        bucket, expires_in = current_bucket()
+        objects = daily_offers(catalog, blend_count, count, bucket)
+        cache_control = f"public, max-age={expires_in}"
+    else:
+        available = catalog.available(blend_count)
+        objects = random.sample(available, min(max(count, 0), len(available)))
 
     if not objects:
         raise HTTPException(status_code=404, detail="No objects available")
 
-    return objects
+    result = project_objects(objects, field_set) if field_set else objects
+    if cache_control:
+        # A projected result is a Response of its own
+        target = result if isinstance(result, Response) else response
+        target.headers["Cache-Control"] = cache_control
+    return result
+
+
+@router.get("/sprites/manifest", response_model=SpriteManifestResponse)
+async def get_sprite_manifest():
+    """
+    Get the current sprite sheet version
+    The client fetches the whole sheet in one cacheable request using the
+    versioned URL, instead of one request per sprite
+    """
+    global _sprite_manifest
+    try:
+        mtime = os.path.getmtime(settings.sprite_manifest_path)
+    except OSError:
+        raise HTTPException(status_code=404, detail="Sprite manifest not found")
+
+    cached_mtime, response = _sprite_manifest
+    if cached_mtime != mtime:
+        with open(settings.sprite_manifest_path) as f:
+            manifest = json.load(f)
+        response = SpriteManifestResponse(
+            version=manifest["version"],
+            sheet=manifest["sheet"],
+            sprite_count=len(manifest["sprites"])
+        )
+        _sprite_manifest = (mtime, response)
+
+    return response
 
 
 @router.get("/{object_id}", response_model=GameObjectResponse)
-async def get_object(object_id: int, db: Session = Depends(get_db)):
+async def get_object(
+    object_id: int,
+    fields: Optional[str] = FIELDS_QUERY,
+    db: Session = Depends(get_read_db)
+):
     """Get a specific game object by ID"""
-    obj = db.query(GameObject).filter(GameObject.id == object_id).first()
+    field_set = parse_fields(fields)
+    obj = get_catalog(db).by_id.get(object_id)
 
     if not obj:
         raise HTTPException(status_code=404, detail="Object not found")
 
+    if field_set:
+        return project_object(obj, field_set)
     return obj
 
 
 @router.get("/", response_model=List[GameObjectResponse])
-async def get_all_objects(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def get_all_objects(
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[str] = FIELDS_QUERY,
+    db: Session = Depends(get_read_db)
+):
     """Get all game objects (for admin/testing)"""
-    objects = db.query(GameObject).offset(skip).limit(limit).all()
+    field_set = parse_fields(fields)
+    query = db.query(GameObject)
+    if field_set:
+        # Only select the requested columns (load_only always adds the primary key)
+        query = query.options(load_only(*(getattr(GameObject, name) for name in field_set)))
+    # A stable order, so skip/limit pages neither repeat nor miss objects
+    objects = query.order_by(GameObject.id).offset(skip).limit(limit).all()
+
+    if field_set:
+        return project_objects(objects, field_set)
     return objects
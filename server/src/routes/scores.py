@@ -1,55 +1,41 @@
 """
 API routes for scoring and blending
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import Dict, List
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy.orm.exc import StaleDataError
+from typing import Dict, List, Optional
 import uuid
 
-from database import get_db
-from models import GameObject, ScoringSystem, PlayerScore
-from schemas import (
-    BlendRequest,
-    BlendResponse,
-    SessionResponse,
-    GameObjectResponse,
-    PlayerScoreCreate,
-    PlayerScoreResponse
-)
+from admission import admit_session
+from catalog import get_catalog
+from config import settings
+from database import LAST_WRITE_HEADER, get_db, get_session_read_db, write_marker
+from models import PlayerScore
+from projection import FIELDS_QUERY, parse_fields, project_session
+from schemas import BlendRequest, BlendResponse, SessionResponse
+from tokens import SessionState, TokenError, issue, verify
 
 router = APIRouter()
 
 
-@router.post("/blend", response_model=BlendResponse)
-async def blend_objects(request: BlendRequest, db: Session = Depends(get_db)):
+def _apply_blend(catalog, blend_count: int, scores: Dict[str, float], object_ids: List[int]) -> Dict:
     """
-    Process a blend request - add object(s) to the blend and calculate scores
+    Validate a blend against the catalog and compute its effects.
+    Updates `scores` in place; shared by database and token sessions.
     """
-    # Get or create player score session
-    player_score = db.query(PlayerScore).filter(
-        PlayerScore.session_id == request.session_id
-    ).first()
-
-    if not player_score:
-        # Create new session
-        player_score = PlayerScore(
-            player_name="Anonymous",
-            session_id=request.session_id,
-            blend_count=0,
-            scores={},
-            blended_objects=[]
-        )
-        db.add(player_score)
-
-    # Get the objects being blended
-    objects = db.query(GameObject).filter(GameObject.id.in_(request.object_ids)).all()
+    objects = [
+        catalog.by_id[object_id]
+        for object_id in dict.fromkeys(object_ids)
+        if object_id in catalog.by_id
+    ]
 
-    if len(objects) != len(request.object_ids):
+    if len(objects) != len(object_ids):
         raise HTTPException(status_code=404, detail="One or more objects not found")
 
     # Check if objects are unlocked
     for obj in objects:
-        if obj.unlock_threshold > player_score.blend_count:
+        if obj.unlock_threshold > blend_count:
             raise HTTPException(
                 status_code=403,
                 detail=f"Object '{obj.name}' is not yet unlocked"
@@ -61,51 +47,132 @@ async def blend_objects(request: BlendRequest, db: Session = Depends(get_db)):
         for scoring_system, value in obj.scores.items():
             scores_added[scoring_system] = scores_added.get(scoring_system, 0) + value
 
+    # Track newly unlocked scoring systems
+    newly_unlocked_systems = [system for system in scores_added if system not in scores]
+
     # Update player scores (preserves all existing systems)
-    current_scores = player_score.scores or {}
     for scoring_system, value in scores_added.items():
-        current_scores[scoring_system] = current_scores.get(scoring_system, 0) + value
+        scores[scoring_system] = scores.get(scoring_system, 0) + value
 
-    # Track newly unlocked scoring systems
-    newly_unlocked_systems = []
-    existing_systems = set(player_score.scores.keys()) if player_score.scores else set()
-    for system in scores_added.keys():
-        if system not in existing_systems:
-            newly_unlocked_systems.append(system)
+    # Check for newly unlocked objects
+    new_count = blend_count + len(objects)
+    return {
+        "blend_count": new_count,
+        "scores_added": scores_added,
+        "newly_unlocked_systems": newly_unlocked_systems,
+        "newly_unlocked_objects": list(catalog.unlocked_between(blend_count, new_count))
+    }
+
+
+def _blend_with_token(request: BlendRequest, catalog, state: SessionState) -> BlendResponse:
+    result = _apply_blend(catalog, state.blend_count, state.scores, request.object_ids)
+    state.blend_count = result["blend_count"]
+    state.rebase(catalog.checksum)
+    state.record_blend(request.object_ids)
+    return BlendResponse(
+        success=True,
+        total_scores=state.scores,
+        session_token=issue(state),
+        **result
+    )
+
+
+@router.post("/blend", response_model=BlendResponse)
+async def blend_objects(request: BlendRequest, response: Response, db: Session = Depends(get_db)):
+    """
+    Process a blend request - add object(s) to the blend and calculate scores
+    With SESSION_TOKENS enabled, the session state is read from and returned
+    as a signed token instead of the database
+    """
+    admit_session(request.session_id)
+    catalog = get_catalog(db)
+
+    if request.session_token:
+        if not settings.session_tokens:
+            raise HTTPException(status_code=400, detail="Session tokens are not enabled")
+        return _blend_with_token(request, catalog, _verify_token(request.session_token, request.session_id))
+
+    try:
+        result = _blend_with_row(request, catalog, db)
+    except StaleDataError:
+        # Session expiry deleted the row between our read and update; carry
+        # on as for any other expired session
+        db.rollback()
+        db.expunge_all()
+        result = _blend_with_row(request, catalog, db)
+    if result.session_token is None:
+        # Written to the database rather than returned as a token
+        response.headers[LAST_WRITE_HEADER] = write_marker()
+    return result
+
+
+def _blend_with_row(request: BlendRequest, catalog, db: Session) -> BlendResponse:
+    """Apply a blend to the session's player_scores row, creating it if missing"""
+    player_score = db.query(PlayerScore).filter(
+        PlayerScore.session_id == request.session_id
+    ).first()
+
+    if not player_score:
+        if settings.session_tokens:
+            # New sessions are stateless; only sessions that predate tokens use the database
+            return _blend_with_token(request, catalog, SessionState(session_id=request.session_id))
+
+        # Create new session
+        player_score = PlayerScore(
+            player_name="Anonymous",
+            session_id=request.session_id,
+            blend_count=0,
+            scores={},
+            blended_objects=[]
+        )
+        db.add(player_score)
+
+    current_scores = dict(player_score.scores or {})
+    result = _apply_blend(catalog, player_score.blend_count or 0, current_scores, request.object_ids)
 
     # Update blend count and blended objects
-    player_score.blend_count += len(objects)
-    blended_list = player_score.blended_objects or []
-    blended_list.extend(request.object_ids)
-    player_score.blended_objects = blended_list
+    player_score.blend_count = result["blend_count"]
+    player_score.blended_objects = (player_score.blended_objects or []) + list(request.object_ids)
     player_score.scores = current_scores
 
-    # Check for newly unlocked objects
-    previous_count = player_score.blend_count - len(objects)
-    newly_unlocked_objects = db.query(GameObject).filter(
-        GameObject.unlock_threshold > previous_count,
-        GameObject.unlock_threshold <= player_score.blend_count
-    ).all()
-
     db.commit()
-    db.refresh(player_score)
 
-    return BlendResponse(
-        success=True,
-        blend_count=player_score.blend_count,
-        scores_added=scores_added,
-        total_scores=current_scores,
-        newly_unlocked_systems=newly_unlocked_systems,
-        newly_unlocked_objects=[
-            GameObjectResponse.model_validate(obj) for obj in newly_unlocked_objects
-        ]
-    )
+    return BlendResponse(success=True, total_scores=current_scores, **result)
+
+
+def _verify_token(token: str, session_id: str) -> SessionState:
+    try:
+        return verify(token, session_id)
+    except TokenError as e:
+        raise HTTPException(status_code=401, detail=str(e))
 
 
 @router.get("/session/{session_id}", response_model=SessionResponse)
-async def get_session(session_id: str, db: Session = Depends(get_db)):
-    """Get current session information"""
-    player_score = db.query(PlayerScore).filter(
+async def get_session(
+    session_id: str,
+    fields: Optional[str] = FIELDS_QUERY,
+    session_token: Optional[str] = Header(default=None, alias="X-Session-Token"),
+    db: Session = Depends(get_session_read_db)
+):
+    """
+    Get current session information
+    `fields` selects the game object fields returned in available_objects
+    """
+    field_set = parse_fields(fields)
+    if session_token and settings.session_tokens:
+        state = _verify_token(session_token, session_id)
+        session = SessionResponse(
+            session_id=session_id,
+            blend_count=state.blend_count,
+            scores=state.scores,
+            unlocked_systems=list(state.scores.keys()),
+            available_objects=list(get_catalog(db).available(state.blend_count))
+        )
+        return project_session(session, field_set) if field_set else session
+
+    player_score = db.query(PlayerScore).options(
+        load_only(PlayerScore.blend_count, PlayerScore.scores)
+    ).filter(
         PlayerScore.session_id == session_id
     ).first()
 
@@ -120,23 +187,20 @@ async def get_session(session_id: str, db: Session = Depends(get_db)):
         )
 
     # Get available objects
-    available_objects = db.query(GameObject).filter(
-        GameObject.unlock_threshold <= player_score.blend_count
-    ).all()
+    available_objects = get_catalog(db).available(player_score.blend_count)
 
-    return SessionResponse(
+    session = SessionResponse(
         session_id=session_id,
         blend_count=player_score.blend_count,
         scores=player_score.scores or {},
         unlocked_systems=list((player_score.scores or {}).keys()),
-        available_objects=[
-            GameObjectResponse.model_validate(obj) for obj in available_objects
-        ]
+        available_objects=list(available_objects)
     )
+    return project_session(session, field_set) if field_set else session
 
 
 @router.post("/reset/{session_id}")
-async def reset_session(session_id: str, db: Session = Depends(get_db)):
+async def reset_session(session_id: str, response: Response, db: Session = Depends(get_db)):
     """Reset a player session"""
     player_score = db.query(PlayerScore).filter(
         PlayerScore.session_id == session_id
@@ -145,11 +209,15 @@ async def reset_session(session_id: str, db: Session = Depends(get_db)):
     if player_score:
         db.delete(player_score)
         db.commit()
+        response.headers[LAST_WRITE_HEADER] = write_marker()
 
     return {"message": "Session reset successfully", "session_id": session_id}
 
 
 @router.get("/new-session")
 async def create_new_session():
-    """Generate a new session ID"""
-    return {"session_id": str(uuid.uuid4())}
+    """Generate a new session ID, and an empty session token when tokens are enabled"""
+    session_id = str(uuid.uuid4())
+    if settings.session_tokens:
+        return {"session_id": session_id, "session_token": issue(SessionState(session_id=session_id))}
+    return {"session_id": session_id}
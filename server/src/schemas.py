@@ -32,6 +32,13 @@ class GameObjectResponse(GameObjectBase):
         from_attributes = True
 
 
+class SpriteManifestResponse(BaseModel):
+    """Schema for the sprite sheet manifest version"""
+    version: str
+    sheet: str
+    sprite_count: int
+
+
 class ScoringSystemBase(BaseModel):
     """Base schema for scoring systems"""
     name: str
@@ -60,6 +67,7 @@ class BlendRequest(BaseModel):
     """Schema for blend requests"""
     session_id: str
     object_ids: List[int]
+    session_token: Optional[str] = None  # With SESSION_TOKENS enabled
 
 
 class BlendResponse(BaseModel):
@@ -70,6 +78,7 @@ class BlendResponse(BaseModel):
     total_scores: Dict[str, float]
     newly_unlocked_systems: List[str]
     newly_unlocked_objects: List[GameObjectResponse]
+    session_token: Optional[str] = None  # Updated token, when the session is token based
 
 
 class PlayerScoreCreate(BaseModel):
@@ -112,10 +121,38 @@ class LeaderboardEntry(BaseModel):
 class LeaderboardResponse(BaseModel):
     """Schema for leaderboard responses"""
     scoring_system: str
+    window: str = "all"
+    unique_players: bool = False
     entries: List[LeaderboardEntry]
     total_entries: int
 
 
+class PlayerSearchResult(BaseModel):
+    """Schema for player search matches"""
+    player_name: str
+    match: str  # "exact", "prefix" or "fuzzy"
+
+
+class PlayerHistoryResponse(BaseModel):
+    """Schema for a page of a player's leaderboard entries"""
+    player_name: str
+    entries: List[LeaderboardEntry]
+    next_cursor: Optional[int] = None
+
+
+class LeaderboardSummaryResponse(BaseModel):
+    """Schema for per scoring system leaderboard summaries"""
+    scoring_system: str
+    entry_count: int
+    player_count: int
+    max_score: float
+    min_score: float
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
 class SessionResponse(BaseModel):
     """Schema for session info responses"""
     session_id: str
@@ -0,0 +1,73 @@
+"""
+Production launcher for the Chaos Blender API
+
+Prepares the database once in the parent process (wait for Postgres, apply
+the schema, optionally load the catalog), then starts uvicorn with several
+worker processes and no auto-reload. Workers inherit SKIP_SCHEMA_CHECK so a
+rollout issues the schema DDL/introspection once instead of once per worker.
+
+Usage: python serve.py [--workers N] [--host HOST] [--port PORT] [--init-data]
+"""
+import argparse
+import logging
+import os
+import sys
+
+import uvicorn
+
+from config import settings
+from database import engine, ensure_schema, read_engine
+from startup import backfill_leaderboards, wait_for_database
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Chaos Blender API in production mode")
+    parser.add_argument("--host", default=settings.host)
+    parser.add_argument("--port", type=int, default=settings.port)
+    parser.add_argument(
+        "--workers", type=int, default=settings.web_concurrency or os.cpu_count() or 1,
+        help="Worker processes (default: WEB_CONCURRENCY or CPU count)"
+    )
+    parser.add_argument(
+        "--init-data", action="store_true",
+        help="Load the game catalog before starting the workers"
+    )
+    parser.add_argument(
+        "--skip-schema-check", action="store_true", default=settings.skip_schema_check,
+        help="Don't create missing tables/indexes before starting"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    wait_for_database()
+    if not args.skip_schema_check:
+        ensure_schema(engine)
+        backfill_leaderboards()
+    if args.init_data:
+        import init_data
+        if init_data.main([]) is None:
+            sys.exit(1)
+
+    # Don't hand pooled connections from the parent to forked workers
+    engine.dispose()
+    read_engine.dispose()
+    os.environ["SKIP_SCHEMA_CHECK"] = "true"
+
+    uvicorn.run(
+        "main:app",
+        app_dir=SRC_DIR,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        reload=False,
+        proxy_headers=True,
+        forwarded_allow_ips=settings.forwarded_allow_ips,
+        access_log=False
+    )
+
+
+if __name__ == "__main__":
+    main()
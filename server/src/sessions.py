@@ -0,0 +1,106 @@
+"""
+Expiry of abandoned player sessions
+
+Every visitor gets a player_scores row that is otherwise only removed by
+reset_session. expire_sessions() removes rows whose last activity is older
+than SESSION_TTL_DAYS, copying them to player_scores_archive first unless
+SESSION_ARCHIVE is off. Work is done in batches of SESSION_EXPIRY_BATCH_SIZE
+rows, each in its own short transaction; on PostgreSQL the batch is
+selected with FOR UPDATE SKIP LOCKED so the workers running this job don't
+wait on each other, and skip rows a blend is updating. A blend can still
+wait for a batch that holds its row, then find the row gone; the blend
+route treats that like any other expired session.
+"""
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from config import settings
+from metrics import Counter, Gauge, registry
+from models import PlayerScore, PlayerScoreArchive
+
+SESSIONS_EXPIRED = registry.register(Counter(
+    "chaos_blender_sessions_expired_total",
+    "Expired player sessions removed from player_scores"
+))
+EXPIRY_RATE = registry.register(Gauge(
+    "chaos_blender_session_expiry_rows_per_second",
+    "Throughput of the last session expiry run that removed rows"
+))
+
+_ARCHIVED_COLUMNS = [
+    "player_name", "session_id", "blend_count", "scores", "blended_objects",
+    "created_at", "updated_at"
+]
+
+
+@dataclass
+class ExpiryReport:
+    """Outcome of one expiry run"""
+    rows: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (
+            f"{self.rows} sessions expired in {self.batches} batches, "
+            f"{self.seconds:.2f}s ({self.rows_per_second:.0f} rows/s)"
+        )
+
+    def __bool__(self):
+        return self.rows > 0
+
+
+def last_active():
+    """SQL expression for a session's last activity (matches ix_player_scores_last_active)"""
+    return func.coalesce(PlayerScore.updated_at, PlayerScore.created_at)
+
+
+def expire_sessions(
+    db: Session,
+    ttl_days: Optional[float] = None,
+    batch_size: Optional[int] = None,
+    archive: Optional[bool] = None,
+    now: Optional[datetime] = None
+) -> ExpiryReport:
+    """Archive (or just delete) sessions idle for longer than the TTL, one committed batch at a time"""
+    ttl_days = settings.session_ttl_days if ttl_days is None else ttl_days
+    batch_size = batch_size or settings.session_expiry_batch_size
+    archive = settings.session_archive if archive is None else archive
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=ttl_days)
+
+    report = ExpiryReport()
+    start = time.perf_counter()
+    while True:
+        ids = db.execute(
+            select(PlayerScore.id)
+            .where(last_active() < cutoff)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).scalars().all()
+        if not ids:
+            break
+        if archive:
+            db.execute(PlayerScoreArchive.__table__.insert().from_select(
+                _ARCHIVED_COLUMNS,
+                select(*(PlayerScore.__table__.c[name] for name in _ARCHIVED_COLUMNS))
+                .where(PlayerScore.id.in_(ids))
+            ))
+        db.execute(delete(PlayerScore).where(PlayerScore.id.in_(ids)))
+        db.commit()
+        report.rows += len(ids)
+        report.batches += 1
+
+    report.seconds = time.perf_counter() - start
+    if report.rows:
+        SESSIONS_EXPIRED.inc(amount=report.rows)
+        EXPIRY_RATE.set(report.rows_per_second)
+    return report
@@ -0,0 +1,95 @@
+"""
+Single-flight coalescing of identical concurrent reads
+
+SingleFlight.do(key, fn) runs the blocking read `fn` in the threadpool.
+Requests for the same key that arrive while it is running don't start
+their own query; they await the same result (or exception). Once the call
+finishes the key is forgotten, so nothing is cached beyond the flight.
+
+`fn` opens its own database session, since its result is shared between
+requests. The call runs as a task of its own that every request awaits
+through asyncio.shield, so a cancelled request (e.g. a client disconnect),
+the leader included, never cancels the call or hands a CancelledError to
+the others. Calls are counted per flight as "leader" (ran the query) or
+"shared" (reused an in-flight one); the coalescing ratio is exported too.
+"""
+import asyncio
+from typing import Callable, Dict, Hashable, List, TypeVar
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from database import SessionLocal
+from metrics import Counter, Gauge, LabelValues, registry
+
+T = TypeVar("T")
+
+SINGLEFLIGHT_CALLS = registry.register(Counter(
+    "chaos_blender_singleflight_calls_total",
+    "Coalescable reads by flight and whether they ran the query (leader) or shared one",
+    ("flight", "role")
+))
+
+
+def _coalesced_ratios() -> Dict[LabelValues, float]:
+    totals: Dict[str, List[float]] = {}
+    with SINGLEFLIGHT_CALLS._lock:
+        items = list(SINGLEFLIGHT_CALLS._values.items())
+    for (flight, role), value in items:
+        shared_and_total = totals.setdefault(flight, [0.0, 0.0])
+        if role == "shared":
+            shared_and_total[0] += value
+        shared_and_total[1] += value
+    return {(flight,): shared / total for flight, (shared, total) in totals.items() if total}
+
+
+registry.register(Gauge(
+    "chaos_blender_singleflight_coalesced_ratio",
+    "Share of reads served by another request's in-flight query",
+    ("flight",),
+    callback=_coalesced_ratios
+))
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key within this worker's event loop"""
+
+    def __init__(self, name: str, session_factory: Callable[[], Session] = SessionLocal):
+        self.name = name
+        self.session_factory = session_factory
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        task = self._inflight.get(key)
+        if task is not None:
+            SINGLEFLIGHT_CALLS.inc((self.name, "shared"))
+        else:
+            SINGLEFLIGHT_CALLS.inc((self.name, "leader"))
+            task = asyncio.ensure_future(run_in_threadpool(fn))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        # Shield so no caller's cancellation cancels the shared call
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved in case every caller was cancelled
+
+    async def query(self, fn: Callable[..., T], *args: Hashable) -> T:
+        """do() keyed by `args`, calling fn(db, *args) with a session of its own"""
+        def run():
+            db = self.session_factory()
+            try:
+                return fn(db, *args)
+            finally:
+                db.close()
+
+        return await self.do(args, run)
+
+
+def record_shared(name: str, shared: bool) -> None:
+    """Count a call coalesced by other means (e.g. a lock and re-check) in the same metrics"""
+    SINGLEFLIGHT_CALLS.inc((name, "shared" if shared else "leader"))
+
@@ -0,0 +1,125 @@
+"""
+Startup tasks shared by the API lifespan and the production launcher
+"""
+import logging
+import threading
+
+from sqlalchemy import exists, select, text
+from sqlalchemy.exc import DBAPIError, OperationalError
+
+import leaderboard_summary
+import leaderboard_windows
+import player_bests
+import player_search
+from catalog import load_catalog
+from config import settings
+from database import SessionLocal, engine, ensure_schema
+from models import (
+    Leaderboard, LeaderboardSummary, LeaderboardWindowCount, LeaderboardWindowEntry, PlayerBest, PlayerName
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Readiness:
+    """Readiness flag reported by GET /ready"""
+
+    def __init__(self):
+        self.ready = False
+        self.detail = "starting"
+        self.stopping = threading.Event()
+
+    def set(self, ready: bool, detail: str):
+        self.ready = ready
+        self.detail = detail
+
+
+readiness = Readiness()
+
+
+def wait_for_database(stop: threading.Event = None):
+    """Block until the database accepts connections (or stop is set)"""
+    stop = stop or threading.Event()
+    attempt = 0
+    while not stop.is_set():
+        attempt += 1
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            return True
+        except OperationalError as e:
+            logger.warning("Database not available (attempt %d): %s", attempt, e.orig or e)
+            stop.wait(settings.startup_retry_interval)
+    return False
+
+
+def _is_empty(db, model) -> bool:
+    return not db.scalar(select(exists().select_from(model)))
+
+
+def backfill_leaderboards():
+    """
+    Fill tables derived from the leaderboard that are empty although their
+    source is not, e.g. right after upgrading from a version without them.
+    Normally a no-op costing a few EXISTS queries.
+    """
+    db = SessionLocal()
+    try:
+        rebuilt = []
+        if not _is_empty(db, Leaderboard):
+            # player_bests first: the summaries' player counts are read from it
+            if _is_empty(db, PlayerBest):
+                rebuilt.append(f"player_bests ({player_bests.rebuild(db)} rows)")
+            if rebuilt or _is_empty(db, LeaderboardSummary):
+                rebuilt.append(f"leaderboard_summaries ({leaderboard_summary.rebuild(db)} rows)")
+            if _is_empty(db, PlayerName):
+                rebuilt.append(f"player_names ({player_search.rebuild(db)} rows)")
+        if _is_empty(db, LeaderboardWindowCount) and not _is_empty(db, LeaderboardWindowEntry):
+            rebuilt.append(f"leaderboard_window_counts ({leaderboard_windows.rebuild_counts(db)} rows)")
+        db.commit()
+        if rebuilt:
+            logger.info("Backfilled %s", ", ".join(rebuilt))
+    except DBAPIError as e:
+        # Another process starting at the same time may be backfilling too
+        db.rollback()
+        logger.warning("Leaderboard backfill failed, leaving it to the next start: %s", e.orig or e)
+    finally:
+        db.close()
+
+
+def warm_caches():
+    """Load in-process caches so the first requests don't pay for it"""
+    db = SessionLocal()
+    try:
+        catalog = load_catalog(db)
+        logger.info(
+            "Catalog loaded: %d objects, %d scoring systems",
+            len(catalog.objects), len(catalog.scoring_systems)
+        )
+        if player_search.uses_trie(db):
+            player_search.trie_index.refresh(db)
+            logger.info("Player search trie loaded: %d names", player_search.trie_index.trie.size)
+    finally:
+        db.close()
+
+
+def initialize(skip_schema_check: bool = None):
+    """
+    Wait for the database, apply the schema unless skipped, warm caches and
+    mark the process ready
+    """
+    if skip_schema_check is None:
+        skip_schema_check = settings.skip_schema_check
+
+    readiness.set(False, "waiting for database")
+    if not wait_for_database(readiness.stopping):
+        return
+
+    if not skip_schema_check:
+        readiness.set(False, "checking schema")
+        ensure_schema(engine)
+        backfill_leaderboards()
+
+    readiness.set(False, "warming caches")
+    warm_caches()
+    readiness.set(True, "ready")
@@ -0,0 +1,188 @@
+"""
+Signed, stateless session tokens (SESSION_TOKENS=true)
+
+Instead of a player_scores row per visitor, the session state travels with
+the client as "<payload>.<signature>": base64url compact JSON signed with
+HMAC-SHA256 under SESSION_TOKEN_SECRET. Each blend verifies the token and
+returns an updated one, so nothing is written until the scores are
+submitted to the leaderboard.
+
+The payload carries the blend count, the scores, how often each object was
+blended and a hash chain over the blended object ids in order. Since the
+per-object counts determine the scores, verify_against_catalog() can
+recompute the scores from the catalog on submit instead of trusting them.
+
+Object counts are kept per catalog checksum: blends after a catalog change
+start a new group, and each group is verified against the scores of the
+catalog it was blended under (kept in catalog_scores), so rebalancing the
+catalog does not invalidate sessions in progress.
+"""
+import base64
+import hashlib
+import hmac
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Optional
+
+from config import settings
+
+TOKEN_VERSION = 1
+
+
+class TokenError(ValueError):
+    """Raised for tokens that are malformed, forged, expired or for another session"""
+
+
+@dataclass
+class SessionState:
+    """Session state carried by a token"""
+    session_id: str
+    blend_count: int = 0
+    scores: Dict[str, float] = field(default_factory=dict)
+    objects: Dict[int, int] = field(default_factory=dict)  # Object id -> times blended
+    digest: str = ""  # Hash chain over the blended object ids, in order
+    issued_at: int = 0
+    catalog: Optional[str] = None  # Checksum of the catalog `objects` were blended under
+    earlier: Dict[str, Dict[int, int]] = field(default_factory=dict)  # Same, for earlier catalogs
+
+    def rebase(self, checksum: Optional[str]) -> None:
+        """Start counting blends under catalog `checksum`, keeping earlier counts apart"""
+        if checksum == self.catalog:
+            return
+        if self.objects:
+            counts = self.earlier.setdefault(self.catalog or "", {})
+            for object_id, count in self.objects.items():
+                counts[object_id] = counts.get(object_id, 0) + count
+        self.objects = {}
+        self.catalog = checksum
+
+    def groups(self):
+        """(catalog checksum, object counts) for every catalog blended under"""
+        yield from self.earlier.items()
+        yield self.catalog, self.objects
+
+    def record_blend(self, object_ids: Iterable[int]) -> None:
+        """Count the blended objects and extend the digest (scores are updated by the caller)"""
+        object_ids = list(object_ids)
+        for object_id in object_ids:
+            self.objects[object_id] = self.objects.get(object_id, 0) + 1
+        chunk = f"{self.digest}:{','.join(map(str, object_ids))}".encode()
+        self.digest = hashlib.sha256(chunk).hexdigest()[:32]
+
+    def blended_objects(self):
+        """Blended object ids, grouped by object (the token does not keep the order)"""
+        totals: Dict[int, int] = {}
+        for _, objects in self.groups():
+            for object_id, count in objects.items():
+                totals[object_id] = totals.get(object_id, 0) + count
+        return [object_id for object_id, count in sorted(totals.items()) for _ in range(count)]
+
+
+def _key() -> bytes:
+    if not settings.session_token_secret:
+        raise RuntimeError("SESSION_TOKEN_SECRET must be set when SESSION_TOKENS is enabled")
+    return settings.session_token_secret.encode()
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(payload: str) -> str:
+    return _b64encode(hmac.new(_key(), payload.encode(), hashlib.sha256).digest())
+
+
+def _encode_counts(objects: Dict[int, int]) -> Dict[str, int]:
+    return {str(object_id): count for object_id, count in objects.items()}
+
+
+def _decode_counts(objects: Dict[str, int]) -> Dict[int, int]:
+    return {int(object_id): count for object_id, count in objects.items()}
+
+
+def issue(state: SessionState) -> str:
+    """Sign the state into a token"""
+    state.issued_at = int(time.time())
+    data = {
+        "v": TOKEN_VERSION,
+        "sid": state.session_id,
+        "n": state.blend_count,
+        "s": state.scores,
+        "o": _encode_counts(state.objects),
+        "c": state.catalog,
+        "h": state.digest,
+        "iat": state.issued_at
+    }
+    if state.earlier:
+        data["e"] = {checksum: _encode_counts(objects) for checksum, objects in state.earlier.items()}
+    payload = _b64encode(json.dumps(data, separators=(",", ":")).encode())
+    return f"{payload}.{_sign(payload)}"
+
+
+def verify(token: str, session_id: str) -> SessionState:
+    """Check the signature, session and age of a token and return its state"""
+    payload, _, signature = token.partition(".")
+    # Compare bytes: compare_digest rejects str with non-ASCII characters
+    if not signature or not hmac.compare_digest(signature.encode(), _sign(payload).encode()):
+        raise TokenError("Invalid session token")
+    try:
+        data = json.loads(_b64decode(payload))
+    except ValueError:
+        raise TokenError("Invalid session token")
+
+    if data.get("v") != TOKEN_VERSION or data.get("sid") != session_id:
+        raise TokenError("Session token does not belong to this session")
+    if time.time() - data["iat"] > settings.session_ttl_days * 86400:
+        raise TokenError("Session token expired")
+
+    return SessionState(
+        session_id=data["sid"],
+        blend_count=data["n"],
+        scores=data["s"],
+        objects=_decode_counts(data["o"]),
+        digest=data["h"],
+        issued_at=data["iat"],
+        # Tokens issued before catalog checksums were recorded count as current
+        catalog=data.get("c"),
+        earlier={checksum: _decode_counts(objects) for checksum, objects in data.get("e", {}).items()}
+    )
+
+
+def verify_against_catalog(
+    state: SessionState,
+    catalog_scores: Callable[[Optional[str]], Optional[Dict[int, Dict[str, float]]]]
+) -> bool:
+    """
+    True if the blend count and scores follow from the blended objects, each
+    group scored by `catalog_scores(checksum)` (object id -> scores, None if
+    that catalog is unknown)
+    """
+    expected: Dict[str, float] = {}
+    blend_count = 0
+    for checksum, objects in state.groups():
+        if not objects:
+            continue
+        object_scores = catalog_scores(checksum or None)
+        if object_scores is None:
+            return False
+        for object_id, count in objects.items():
+            scores = object_scores.get(object_id)
+            if scores is None:
+                return False
+            blend_count += count
+            for scoring_system, value in scores.items():
+                expected[scoring_system] = expected.get(scoring_system, 0) + value * count
+    if state.blend_count != blend_count:
+        return False
+    if expected.keys() != state.scores.keys():
+        return False
+    return all(
+        math.isclose(state.scores[system], value, rel_tol=1e-9, abs_tol=1e-6)
+        for system, value in expected.items()
+    )